@@ -1,4 +1,6 @@
+from dataclasses import InitVar, dataclass, field
 from enum import Enum, auto
+from typing import Optional
 
 class Profession(Enum):
     # CRAFTING PROFESSIONS (July 2025 Quinfall System)
@@ -80,13 +82,20 @@ class Specialization(Enum):
     ENGINEERING = auto()
     TAILORING = auto()
 
+@dataclass(slots=True, eq=False)
 class Recipe:
-    def __init__(self, name: str, profession: Profession, tier: ProfessionTier, 
-                 materials: dict, tool: ToolType, tool_level: int, skill_level: int):
-        self.name = name
-        self.profession = profession
-        self.tier = tier
-        self.materials = materials
+    name: str
+    profession: Profession
+    tier: ProfessionTier
+    materials: dict
+    tool: InitVar[ToolType]
+    tool_level: int
+    skill_level: int = 1
+    required_tool: ToolType = field(init=False)
+    tier_value: int = field(init=False)  # tier.value, resolved once
+    material_prices: Optional[dict] = None
+    output_prices: Optional[list] = None
+
+    def __post_init__(self, tool: ToolType):
         self.required_tool = tool
-        self.tool_level = tool_level
-        self.skill_level = skill_level
+        self.tier_value = self.tier.value
@@ -1,14 +1,37 @@
 from data.enums import Profession, ToolType, GatheringProfession, Specialization
 from data.storage_system import QuinfallStorageSystem, StorageLocation
 from data.quinfall_materials import QUINFALL_MATERIALS, get_all_material_names
-import json
 from pathlib import Path
 import logging
+from utils import json_io
 
 logger = logging.getLogger(__name__)
 
+# Journal size at which save() folds it back into player.json
+JOURNAL_COMPACT_BYTES = 4096
+
 class Player:
+    # Decoded save state per save path, keyed on the file's st_mtime_ns
+    _CACHE = {}
+    _PERSISTED = ("skills", "tools", "tool_types", "profession_tool_levels")
+    # Storage locations counted as "storage" (everything but the inventory)
+    _MAIN_STORAGE = (StorageLocation.MEADOW_BANK,
+                     StorageLocation.MEADOW_STORAGE,
+                     StorageLocation.STARTER_COTTAGE_STORAGE)
+    
     def __init__(self):
+        self.reset()
+        
+        # Quinfall Storage System (multi-location support)
+        self.storage_system = QuinfallStorageSystem(player_id="default_player")
+        
+        self.save_path = Path("saves/player.json")
+        self.journal_path = self.save_path.with_suffix(".journal")
+        self._persisted = None  # State as last written, to journal only changes
+        self._synced_stamp = None  # On-disk stamp at which _persisted matched the files
+        
+    def reset(self):
+        """Reset skills, tools and tool preferences to new-player defaults (storage is untouched)"""
         self.skills = {prof: 1 for prof in Profession}
         self.tools = {tool: 1 for tool in ToolType}
         self.gathering = {g: 1 for g in GatheringProfession}
@@ -16,11 +39,6 @@ class Player:
         self.tool_types = {prof: "Basic" for prof in Profession}  # Tool type per profession
         self.profession_tool_levels = {prof: 1 for prof in Profession}  # Tool level per profession
         
-        # Quinfall Storage System (multi-location support)
-        self.storage_system = QuinfallStorageSystem(player_id="default_player")
-        
-        self.save_path = Path("saves/player.json")
-        
     def get_item_count(self, item_name, source="both"):
         """Get item count from inventory, storage, or both"""
         if source == "inventory":
@@ -28,14 +46,31 @@ class Player:
         elif source == "storage":
             # Get from main storage locations (excluding inventory)
             total = 0
-            for location in [StorageLocation.MEADOW_BANK, 
-                           StorageLocation.MEADOW_STORAGE,
-                           StorageLocation.STARTER_COTTAGE_STORAGE]:
+            for location in self._MAIN_STORAGE:
                 total += self.storage_system.get_item_count(item_name, location)
             return total
         else:  # both
             return self.storage_system.get_item_count(item_name)  # Total across all locations
     
+    def get_item_counts(self, item_names, source="both"):
+        """Counts for several items at once, visiting each storage container once"""
+        containers = self.storage_system.containers
+        if source == "inventory":
+            selected = [containers.get(StorageLocation.PLAYER_INVENTORY)]
+        elif source == "storage":
+            selected = [containers.get(location) for location in self._MAIN_STORAGE]
+        else:  # both
+            selected = containers.values()
+        
+        counts = dict.fromkeys(item_names, 0)
+        for container in selected:
+            if container is None:
+                continue
+            items = container.items
+            for name in counts:
+                counts[name] += items.get(name, 0)
+        return counts
+    
     def set_item_count(self, item_name, count, location="storage"):
         """Set item count in inventory or storage"""
         if location == "inventory":
@@ -114,117 +149,223 @@ class Player:
         
         return True, f"Successfully crafted {quantity}x {recipe.name}"
     
-    def save(self):
-        self.save_path.parent.mkdir(exist_ok=True)
-        data = {
+    def _state_dict(self) -> dict:
+        """Persisted state keyed by enum name, as written to disk"""
+        return {
             "skills": {p.name: lvl for p, lvl in self.skills.items()},
             "tools": {t.name: lvl for t, lvl in self.tools.items()},
             "tool_types": {p.name: tool_type for p, tool_type in self.tool_types.items()},
             "profession_tool_levels": {p.name: lvl for p, lvl in self.profession_tool_levels.items()}
         }
-        self.save_path.write_text(json.dumps(data, indent=2))
+        
+    def save(self):
+        """Append the entries changed since the last save to the journal"""
+        size = self._append_journal()
+        if size is not None and size > JOURNAL_COMPACT_BYTES:
+            self.compact()
         
         # Save storage system separately
         self.storage_system.save()
         
-    def load(self):
-        if self.save_path.exists():
-            data = json.loads(self.save_path.read_text())
-            
-            # Migrate old profession data
-            migrated_skills = {}
-            for p, lvl in data["skills"].items():
+    def _append_journal(self):
+        """Append the delta since the last save; returns the journal size, or None if unchanged"""
+        state = self._state_dict()
+        previous = self._persisted or {}
+        delta = {}
+        for section, values in state.items():
+            old_values = previous.get(section, {})
+            changed = {k: v for k, v in values.items() if old_values.get(k) != v}
+            if changed:
+                delta[section] = changed
+        if not delta:
+            return None
+        
+        # Other Player instances append to the same file, so it is opened per save
+        in_sync = self._synced_stamp == self._state_stamp()
+        try:
+            journal = open(self.journal_path, 'ab')
+        except FileNotFoundError:
+            # main() creates saves/ at startup; scripts and tests may run without it
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            journal = open(self.journal_path, 'ab')
+        with journal:
+            if journal.tell() and not self._journal_ends_with_newline():
+                # Terminate a torn last line so this delta starts on its own line
+                journal.write(b'\n')
+            journal.write(json_io.dumps(delta) + b'\n')
+            size = journal.tell()
+        self._persisted = state
+        if in_sync:
+            self._remember_state()
+        else:
+            # Another instance wrote since this one last read; the cache no longer matches disk
+            Player._CACHE.pop(str(self.save_path), None)
+            self._synced_stamp = None
+        return size
+        
+    def compact(self):
+        """Fold the journal into player.json, keeping other instances' saved changes"""
+        self._append_journal()
+        self._apply_state(self._read_state())
+        state = self._state_dict()
+        json_io.dump_path(self.save_path, state, indent=True)
+        # Emptied in place rather than deleted so instances appending later reuse the same file
+        with open(self.journal_path, 'wb'):
+            pass
+        self._persisted = state
+        self._remember_state()
+        
+    def _state_stamp(self):
+        """Identifies the on-disk state: save file mtime plus journal length"""
+        try:
+            base = self.save_path.stat().st_mtime_ns
+        except OSError:
+            base = None
+        try:
+            journal = self.journal_path.stat().st_size
+        except OSError:
+            journal = None
+        return base, journal
+
+    def _journal_ends_with_newline(self) -> bool:
+        """True if the journal's last byte terminates a line"""
+        with open(self.journal_path, 'rb') as f:
+            f.seek(-1, 2)
+            return f.read(1) == b'\n'
+
+    def _remember_state(self):
+        """Cache copies of the persisted dicts against the on-disk stamp"""
+        state = {name: dict(getattr(self, name)) for name in self._PERSISTED}
+        self._synced_stamp = self._state_stamp()
+        Player._CACHE[str(self.save_path)] = (self._synced_stamp, state)
+        
+    def _restore_cached_state(self) -> bool:
+        """Apply cached state if nothing on disk changed since it was read"""
+        cached = Player._CACHE.get(str(self.save_path))
+        if not cached or cached[0] != self._state_stamp():
+            return False
+        for name, values in cached[1].items():
+            setattr(self, name, dict(values))
+        self._synced_stamp = cached[0]
+        return True
+        
+    def _read_state(self) -> dict:
+        """Read player.json and replay journal deltas on top of it"""
+        data = json_io.load_path(self.save_path) if self.save_path.exists() else {}
+        if self.journal_path.exists():
+            for line in self.journal_path.read_bytes().splitlines():
+                try:
+                    delta = json_io.loads(line)
+                except ValueError:
+                    continue  # Torn line from an interrupted write
+                for section, values in delta.items():
+                    data.setdefault(section, {}).update(values)
+        return data
+        
+    def _apply_state(self, data: dict):
+        """Populate skills, tools and tool settings from saved data, migrating old names"""
+        # Migrate old profession data
+        migrated_skills = {}
+        for p, lvl in data.get("skills", {}).items():
+            if p == "BLACKSMITHING":
+                # Split old BLACKSMITHING into WEAPONSMITH and ARMORSMITH
+                migrated_skills["WEAPONSMITH"] = lvl
+                migrated_skills["ARMORSMITH"] = lvl
+                logger.info(f"Migrated BLACKSMITHING level {lvl} to both WEAPONSMITH and ARMORSMITH")
+            else:
+                migrated_skills[p] = lvl
+
+        # Load skills with migration
+        self.skills = {}
+        for p, lvl in migrated_skills.items():
+            try:
+                self.skills[Profession[p]] = lvl
+            except KeyError:
+                logger.warning(f"Unknown profession '{p}' in save data, skipping")
+
+        # Ensure all current professions have a skill level
+        for prof in Profession:
+            if prof not in self.skills:
+                self.skills[prof] = 1
+
+        # Migrate tool data similarly
+        migrated_tools = {}
+        for t, lvl in data.get("tools", {}).items():
+            if t == "BASIC":  # Handle old tool type names if needed
+                continue  # Skip old basic tool type
+            migrated_tools[t] = lvl
+
+        self.tools = {}
+        for t, lvl in migrated_tools.items():
+            try:
+                self.tools[ToolType[t]] = lvl
+            except KeyError:
+                logger.warning(f"Unknown tool type '{t}' in save data, skipping")
+
+        # Ensure all current tools have a level
+        for tool in ToolType:
+            if tool not in self.tools:
+                self.tools[tool] = 1
+
+        # Load tool types if available
+        if "tool_types" in data:
+            migrated_tool_types = {}
+            for p, tool_type in data["tool_types"].items():
                 if p == "BLACKSMITHING":
-                    # Split old BLACKSMITHING into WEAPONSMITH and ARMORSMITH
-                    migrated_skills["WEAPONSMITH"] = lvl
-                    migrated_skills["ARMORSMITH"] = lvl
-                    logger.info(f"Migrated BLACKSMITHING level {lvl} to both WEAPONSMITH and ARMORSMITH")
+                    migrated_tool_types["WEAPONSMITH"] = tool_type
+                    migrated_tool_types["ARMORSMITH"] = tool_type
                 else:
-                    migrated_skills[p] = lvl
-            
-            # Load skills with migration
-            self.skills = {}
-            for p, lvl in migrated_skills.items():
+                    migrated_tool_types[p] = tool_type
+
+            self.tool_types = {}
+            for p, tool_type in migrated_tool_types.items():
                 try:
-                    self.skills[Profession[p]] = lvl
+                    self.tool_types[Profession[p]] = tool_type
                 except KeyError:
-                    logger.warning(f"Unknown profession '{p}' in save data, skipping")
-            
-            # Ensure all current professions have a skill level
-            for prof in Profession:
-                if prof not in self.skills:
-                    self.skills[prof] = 1
-            
-            # Migrate tool data similarly
-            migrated_tools = {}
-            for t, lvl in data["tools"].items():
-                if t == "BASIC":  # Handle old tool type names if needed
-                    continue  # Skip old basic tool type
-                migrated_tools[t] = lvl
-            
-            self.tools = {}
-            for t, lvl in migrated_tools.items():
+                    logger.warning(f"Unknown profession '{p}' in tool_types, skipping")
+        else:
+            self.tool_types = {prof: "Basic" for prof in Profession}
+
+        # Ensure all current professions have a tool type
+        for prof in Profession:
+            if prof not in self.tool_types:
+                self.tool_types[prof] = "Basic"
+
+        # Load profession tool levels if available
+        if "profession_tool_levels" in data:
+            migrated_prof_tool_levels = {}
+            for p, lvl in data["profession_tool_levels"].items():
+                if p == "BLACKSMITHING":
+                    migrated_prof_tool_levels["WEAPONSMITH"] = lvl
+                    migrated_prof_tool_levels["ARMORSMITH"] = lvl
+                else:
+                    migrated_prof_tool_levels[p] = lvl
+
+            self.profession_tool_levels = {}
+            for p, lvl in migrated_prof_tool_levels.items():
                 try:
-                    self.tools[ToolType[t]] = lvl
+                    self.profession_tool_levels[Profession[p]] = lvl
                 except KeyError:
-                    logger.warning(f"Unknown tool type '{t}' in save data, skipping")
-            
-            # Ensure all current tools have a level
-            for tool in ToolType:
-                if tool not in self.tools:
-                    self.tools[tool] = 1
-            
-            # Load tool types if available
-            if "tool_types" in data:
-                migrated_tool_types = {}
-                for p, tool_type in data["tool_types"].items():
-                    if p == "BLACKSMITHING":
-                        migrated_tool_types["WEAPONSMITH"] = tool_type
-                        migrated_tool_types["ARMORSMITH"] = tool_type
-                    else:
-                        migrated_tool_types[p] = tool_type
-                
-                self.tool_types = {}
-                for p, tool_type in migrated_tool_types.items():
-                    try:
-                        self.tool_types[Profession[p]] = tool_type
-                    except KeyError:
-                        logger.warning(f"Unknown profession '{p}' in tool_types, skipping")
-            else:
-                self.tool_types = {prof: "Basic" for prof in Profession}
-            
-            # Ensure all current professions have a tool type
-            for prof in Profession:
-                if prof not in self.tool_types:
-                    self.tool_types[prof] = "Basic"
-            
-            # Load profession tool levels if available
-            if "profession_tool_levels" in data:
-                migrated_prof_tool_levels = {}
-                for p, lvl in data["profession_tool_levels"].items():
-                    if p == "BLACKSMITHING":
-                        migrated_prof_tool_levels["WEAPONSMITH"] = lvl
-                        migrated_prof_tool_levels["ARMORSMITH"] = lvl
-                    else:
-                        migrated_prof_tool_levels[p] = lvl
-                
-                self.profession_tool_levels = {}
-                for p, lvl in migrated_prof_tool_levels.items():
-                    try:
-                        self.profession_tool_levels[Profession[p]] = lvl
-                    except KeyError:
-                        logger.warning(f"Unknown profession '{p}' in profession_tool_levels, skipping")
-            else:
-                self.profession_tool_levels = {prof: 1 for prof in Profession}
-            
-            # Ensure all current professions have a tool level
-            for prof in Profession:
-                if prof not in self.profession_tool_levels:
-                    self.profession_tool_levels[prof] = 1
+                    logger.warning(f"Unknown profession '{p}' in profession_tool_levels, skipping")
+        else:
+            self.profession_tool_levels = {prof: 1 for prof in Profession}
+
+        # Ensure all current professions have a tool level
+        for prof in Profession:
+            if prof not in self.profession_tool_levels:
+                self.profession_tool_levels[prof] = 1
+        
+    def load(self):
+        if self.save_path.exists() or self.journal_path.exists():
+            if not self._restore_cached_state():
+                self._apply_state(self._read_state())
+                self._remember_state()
         else:
             # Initialize defaults for new player
             self.reset_inventory(0)
             self.reset_storage(1000)
+        # Defaults count as persisted, so a first save never writes them over another instance's
+        self._persisted = self._state_dict()
         
         # Load storage system
         self.storage_system.load()
@@ -502,6 +502,14 @@ class QuinfallStorageSystem:
                 total += container.get_item_count(material_id)
             return total
     
+    def snapshot(self) -> Dict[str, int]:
+        """Total count of every stored item across all locations, in one pass"""
+        totals: Dict[str, int] = {}
+        for container in self.containers.values():
+            for material_id, quantity in container.items.items():
+                totals[material_id] = totals.get(material_id, 0) + quantity
+        return totals
+    
     def set_item_count(self, material_id: str, quantity: int, location: StorageLocation):
         """Set item count at specific location"""
         container = self.containers.get(location)
@@ -4,7 +4,7 @@ from PySide6.QtWidgets import (QMainWindow, QApplication, QWidget, QScrollArea,
 from PySide6.QtCore import QTimer, Qt, Signal
 from PySide6.QtGui import QAction, QIcon
 from ui.main_window import MainTabs
-from ui.api_settings_dialog import APISettingsDialog
+from ui.api_settings_dialog import APISettingsDialog, read_api_settings
 from data.player import Player
 import logging
 import sys
@@ -29,8 +29,12 @@ class CompanionApp(QMainWindow):
         self.player = Player()
         self.player.load()
         
-        # API sync timer
+        # API settings dialog, built on first open and reused afterwards
+        self._api_settings_dialog = None
+        
+        # API sync timer; single-shot and re-armed after each sync so runs never stack
         self.sync_timer = QTimer()
+        self.sync_timer.setSingleShot(True)
         self.sync_timer.timeout.connect(self.auto_sync)
         
         # Initialize UI
@@ -191,12 +195,8 @@ class CompanionApp(QMainWindow):
     def load_api_settings(self):
         """Load API settings and configure auto-sync"""
         try:
-            settings_file = Path("saves/api_settings.json")
-            if settings_file.exists():
-                import json
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
-                
+            settings = read_api_settings()
+            if settings is not None:
                 # Configure auto-sync
                 if settings.get('auto_sync_enabled', False):
                     interval = settings.get('sync_interval', 5) * 60000  # Convert to milliseconds
@@ -239,8 +239,11 @@ class CompanionApp(QMainWindow):
     
     def open_api_settings(self):
         """Open API settings dialog"""
-        dialog = APISettingsDialog(self)
-        dialog.exec()
+        if self._api_settings_dialog is None:
+            self._api_settings_dialog = APISettingsDialog(self, self.player.storage_system)
+        else:
+            self._api_settings_dialog.reload_settings()
+        self._api_settings_dialog.exec()
         
         # Reload settings after dialog closes
         self.load_api_settings()
@@ -288,17 +291,21 @@ class CompanionApp(QMainWindow):
         except Exception as e:
             logger.error(f"Auto-sync error: {e}")
             self.api_status_label.setText("❌ API: Auto-sync error")
+        finally:
+            self.schedule_next_sync()
+    
+    def schedule_next_sync(self):
+        """Arm the auto-sync timer one interval after the last sync finished"""
+        if self.auto_sync_action.isChecked():
+            self.sync_timer.start()
     
     def toggle_auto_sync(self, checked):
         """Toggle automatic sync on/off"""
         if checked:
             # Load settings to get interval
             try:
-                settings_file = Path("saves/api_settings.json")
-                if settings_file.exists():
-                    import json
-                    with open(settings_file, 'r') as f:
-                        settings = json.load(f)
+                settings = read_api_settings()
+                if settings is not None:
                     interval = settings.get('sync_interval', 5) * 60000
                 else:
                     interval = 300000  # Default 5 minutes
@@ -382,18 +389,14 @@ class CompanionApp(QMainWindow):
         """Handle application close event"""
         try:
             # Sync on shutdown if enabled
-            settings_file = Path("saves/api_settings.json")
-            if settings_file.exists():
-                import json
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
-                
-                if settings.get('sync_on_shutdown', False):
-                    logger.info("🔄 Performing shutdown sync...")
-                    self.player.storage_system.sync_with_api()
+            settings = read_api_settings()
+            if settings is not None and settings.get('sync_on_shutdown', False):
+                logger.info("🔄 Performing shutdown sync...")
+                self.player.storage_system.sync_with_api()
             
-            # Save player data
+            # Save player data and fold the save journal into player.json
             self.player.save()
+            self.player.compact()
             logger.info("💾 Player data saved on shutdown")
             
         except Exception as e:
@@ -411,6 +414,9 @@ def main():
     if icon_path.exists():
         app.setWindowIcon(QIcon(str(icon_path)))
     
+    # Settings, credentials and save files all live here
+    Path("saves").mkdir(parents=True, exist_ok=True)
+    
     window = CompanionApp()
     
     # Handle system exit
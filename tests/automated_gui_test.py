@@ -8,6 +8,7 @@ import sys
 import time
 import json
 import logging
+from collections import Counter
 from pathlib import Path
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QTimer, Qt
@@ -21,6 +22,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from main import CompanionApp
 from data.enums import Profession
 
+EXPECTED_PROFS = frozenset({'WEAPONSMITH', 'COOKING', 'WOODWORKING', 'TAILORING', 'ALCHEMY'})
+
 class AutomatedGUITest:
     def __init__(self):
         self.app = None
@@ -62,6 +65,13 @@ class AutomatedGUITest:
             self.log_result("Application Setup", False, f"Error: {e}")
             return False
     
+    def app_ready(self):
+        """Check that setup produced a usable window; log a skip otherwise"""
+        if self.main_window is None or self.crafting_tab is None:
+            self.log_result(f"Cycle {self.current_cycle}", False, "Skipped: app not set up")
+            return False
+        return True
+    
     def test_recipe_loading(self):
         """Test that recipes are loaded from all professions"""
         try:
@@ -71,16 +81,10 @@ class AutomatedGUITest:
             self.log_result("Recipe Loading", total_recipes >= 30, f"Loaded {total_recipes} recipes")
             
             # Check profession distribution
-            professions = {}
-            for recipe in CRAFTING_RECIPES:
-                prof = recipe.profession.name if hasattr(recipe.profession, 'name') else str(recipe.profession)
-                professions[prof] = professions.get(prof, 0) + 1
-            
-            expected_profs = ['WEAPONSMITH', 'COOKING', 'WOODWORKING', 'TAILORING', 'ALCHEMY']
-            found_profs = list(professions.keys())
+            professions = Counter(r.profession.name for r in CRAFTING_RECIPES)
             
-            success = len(set(expected_profs) & set(found_profs)) >= 4
-            self.log_result("Multi-Profession Loading", success, f"Found: {professions}")
+            success = len(professions.keys() & EXPECTED_PROFS) >= 4
+            self.log_result("Multi-Profession Loading", success, f"Found: {dict(professions)}")
             
             return success
         except Exception as e:
@@ -265,7 +269,7 @@ class AutomatedGUITest:
         logger.info("\n🚀 STARTING CYCLE 1: Basic Functionality Test")
         self.current_cycle = 1
         
-        if not self.setup_app():
+        if not self.setup_app() or not self.app_ready():
             return False
         
         success = True
@@ -281,6 +285,9 @@ class AutomatedGUITest:
         logger.info("\n🔄 STARTING CYCLE 2: State Persistence Test")
         self.current_cycle = 2
         
+        if not self.app_ready():
+            return False
+        
         success = True
         success &= self.test_state_persistence()
         success &= self.test_tool_type_buttons()
@@ -292,6 +299,9 @@ class AutomatedGUITest:
         logger.info("\n⚙️ STARTING CYCLE 3: Advanced Logic Test")
         self.current_cycle = 3
         
+        if not self.app_ready():
+            return False
+        
         success = True
         success &= self.test_pagination()
         success &= self.test_price_configuration()
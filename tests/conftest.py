@@ -0,0 +1,23 @@
+"""
+Shared pytest fixtures for the Quinfall Companion test suite
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Project root on the import path once per session, for every test module
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+@pytest.fixture(scope="session")
+def recipes():
+    """All crafting recipes, loaded once per test session"""
+    from ui.crafting_tab import load_recipes
+    return load_recipes()
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Single QApplication shared by every widget test"""
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    yield app
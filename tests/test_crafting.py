@@ -1,25 +1,25 @@
-import unittest
-from PySide6.QtWidgets import QApplication
+import pytest
 from data.enums import Profession, Recipe, ProfessionTier, ToolType
 from ui.crafting_tab import CraftingTab
 from data.player import Player
 
-app = QApplication([])
+@pytest.fixture(scope="module")
+def crafting_tab(qapp):
+    # Building the tab is expensive; share one per module
+    return CraftingTab(Player())
 
-class TestCraftingErrors(unittest.TestCase):
-    def setUp(self):
-        self.player = Player()
-        self.crafting_tab = CraftingTab()
-        self.crafting_tab.player = self.player
-        
-    def test_skill_level_error(self):
-        recipe = Recipe("Test Item", Profession.WEAPONSMITH, 
-                       ProfessionTier.MASTER, {}, ToolType.FORGE, 1)
-        result = self.crafting_tab.craft_item(recipe)
-        self.assertFalse(result)
-        
-    def test_tool_level_error(self):
-        recipe = Recipe("Test Item", Profession.WEAPONSMITH,
-                       ProfessionTier.APPRENTICE, {}, ToolType.FORGE, 5)
-        result = self.crafting_tab.craft_item(recipe)
-        self.assertFalse(result)
+@pytest.fixture
+def tab(crafting_tab):
+    # Only player state differs between tests, so reset it instead of rebuilding
+    crafting_tab.player.reset()
+    return crafting_tab
+
+def test_skill_level_error(tab):
+    recipe = Recipe("Test Item", Profession.WEAPONSMITH, 
+                   ProfessionTier.MASTER, {}, ToolType.FORGE, 1)
+    assert not tab.craft_item(recipe)
+
+def test_tool_level_error(tab):
+    recipe = Recipe("Test Item", Profession.WEAPONSMITH,
+                   ProfessionTier.APPRENTICE, {}, ToolType.FORGE, 5)
+    assert not tab.craft_item(recipe)
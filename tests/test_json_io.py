@@ -0,0 +1,8 @@
+from utils import json_io
+
+
+def test_dump_path_creates_missing_parent(tmp_path):
+    target = tmp_path / "saves" / "settings.json"
+    json_io.dump_path(target, {"enabled": True})
+    assert json_io.load_path(target) == {"enabled": True}
+    assert list(target.parent.iterdir()) == [target]
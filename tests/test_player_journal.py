@@ -0,0 +1,167 @@
+import pytest
+
+import data.player as player_module
+from data.enums import Profession
+from data.player import Player
+from utils import json_io
+
+
+@pytest.fixture
+def make_player(tmp_path):
+    """Build players that save under tmp_path instead of saves/"""
+    Player._CACHE.clear()
+
+    def factory():
+        player = Player()
+        player.save_path = tmp_path / "player.json"
+        player.journal_path = player.save_path.with_suffix(".journal")
+        player.storage_system.save_path = tmp_path / "storage.json"
+        return player
+
+    yield factory
+    Player._CACHE.clear()
+
+
+def reload(make_player):
+    Player._CACHE.clear()
+    player = make_player()
+    player.load()
+    return player
+
+
+def test_journal_round_trip(make_player):
+    player = make_player()
+    player.load()
+    player.skills[Profession.WEAPONSMITH] = 42
+    player.save()
+    player.skills[Profession.COOKING] = 7
+    player.save()
+
+    assert player.journal_path.exists()
+    assert not player.save_path.exists()
+    assert len(player.journal_path.read_bytes().splitlines()) == 2
+
+    loaded = reload(make_player)
+    assert loaded.skills[Profession.WEAPONSMITH] == 42
+    assert loaded.skills[Profession.COOKING] == 7
+
+
+def test_save_after_torn_line_keeps_new_delta(make_player):
+    player = make_player()
+    player.load()
+    player.skills[Profession.WEAPONSMITH] = 42
+    player.save()
+    with open(player.journal_path, 'ab') as f:
+        f.write(b'{"skills": {"COOK')  # Interrupted write
+
+    resumed = reload(make_player)
+    assert resumed.skills[Profession.WEAPONSMITH] == 42
+    resumed.skills[Profession.COOKING] = 7
+    resumed.save()
+
+    loaded = reload(make_player)
+    assert loaded.skills[Profession.WEAPONSMITH] == 42
+    assert loaded.skills[Profession.COOKING] == 7
+
+
+def test_save_compacts_past_threshold(make_player, monkeypatch):
+    monkeypatch.setattr(player_module, "JOURNAL_COMPACT_BYTES", 8)
+    player = make_player()
+    player.load()
+    player.skills[Profession.WEAPONSMITH] = 42
+    player.save()
+
+    assert player.journal_path.read_bytes() == b''
+    assert json_io.load_path(player.save_path)["skills"]["WEAPONSMITH"] == 42
+
+
+def test_reload_after_compact(make_player):
+    player = make_player()
+    player.load()
+    player.skills[Profession.WEAPONSMITH] = 42
+    player.save()
+    player.compact()
+    assert player.journal_path.read_bytes() == b''
+
+    player.skills[Profession.COOKING] = 7
+    player.save()
+    assert len(player.journal_path.read_bytes().splitlines()) == 1
+
+    loaded = reload(make_player)
+    assert loaded.skills[Profession.WEAPONSMITH] == 42
+    assert loaded.skills[Profession.COOKING] == 7
+
+
+def test_cache_invalidated_by_external_write(make_player):
+    player = make_player()
+    player.load()
+    player.skills[Profession.WEAPONSMITH] = 42
+    player.save()
+
+    cached = make_player()
+    cached.load()
+    assert cached.skills[Profession.WEAPONSMITH] == 42
+
+    with open(player.journal_path, 'ab') as f:
+        f.write(json_io.dumps({"skills": {"WEAPONSMITH": 50}}) + b'\n')
+    appended = make_player()
+    appended.load()
+    assert appended.skills[Profession.WEAPONSMITH] == 50
+
+    player.journal_path.unlink()
+    json_io.dump_path(player.save_path, {"skills": {"WEAPONSMITH": 60}})
+    replaced = make_player()
+    replaced.load()
+    assert replaced.skills[Profession.WEAPONSMITH] == 60
+
+
+def test_compact_keeps_other_instances_changes(make_player):
+    first = make_player()
+    first.load()
+    second = make_player()
+    second.load()
+
+    second.skills[Profession.WEAPONSMITH] = 42
+    second.save()
+    first.compact()
+    assert first.skills[Profession.WEAPONSMITH] == 42
+
+    second.skills[Profession.ARMORSMITH] = 77
+    second.save()
+    first.skills[Profession.COOKING] = 7
+    first.save()
+
+    loaded = reload(make_player)
+    assert loaded.skills[Profession.WEAPONSMITH] == 42
+    assert loaded.skills[Profession.ARMORSMITH] == 77
+    assert loaded.skills[Profession.COOKING] == 7
+
+
+def test_cache_not_reused_after_other_instance_saves(make_player):
+    first = make_player()
+    first.load()
+    second = make_player()
+    second.load()
+
+    second.skills[Profession.WEAPONSMITH] = 42
+    second.save()
+    first.skills[Profession.COOKING] = 7
+    first.save()
+
+    cached = make_player()
+    cached.load()  # No _CACHE.clear(): must not serve first's stale view
+    assert cached.skills[Profession.WEAPONSMITH] == 42
+    assert cached.skills[Profession.COOKING] == 7
+
+
+def test_save_creates_missing_saves_dir(tmp_path):
+    Player._CACHE.clear()
+    player = Player()
+    player.save_path = tmp_path / "saves" / "player.json"
+    player.journal_path = player.save_path.with_suffix(".journal")
+    player.storage_system.save_path = tmp_path / "storage.json"
+    player.skills[Profession.WEAPONSMITH] = 42
+    player.save()
+    assert player.journal_path.exists()
+    Player._CACHE.clear()
+
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Simple Functionality Test for Quinfall Companion App
+Tests core functionality without complex GUI automation.
+"""
+
+import sys
+import json
+import logging
+import tempfile
+from collections import Counter, namedtuple
+from pathlib import Path
+
+import pytest
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+EXPECTED_PROFS = frozenset({'WEAPONSMITH', 'COOKING', 'WOODWORKING', 'TAILORING', 'ALCHEMY'})
+
+RecipeStats = namedtuple("RecipeStats", "total prof_counts valid issues with_prices without_prices")
+
+def collect_recipe_stats(recipes) -> RecipeStats:
+    """Gather loading, integrity and price statistics in one pass"""
+    prof_counts = Counter()
+    issues = []  # (index, name) pairs; only the few that get logged are formatted
+    with_prices = 0
+    for i, r in enumerate(recipes):
+        prof_counts[r.profession.name] += 1
+        if not (r.name and r.skill_level >= 1 and r.materials):
+            issues.append((i, r.name))
+        if r.material_prices and r.output_prices:
+            with_prices += 1
+    total = len(recipes)
+    return RecipeStats(total, prof_counts, total - len(issues), issues,
+                       with_prices, total - with_prices)
+
+@pytest.fixture(scope="session")
+def recipe_stats(recipes):
+    """Recipe statistics shared by the loading, integrity and price tests"""
+    return collect_recipe_stats(recipes)
+
+def check_recipe_loading(stats):
+    """Log recipe counts per profession; returns (success, total, prof_counts)"""
+    logger.info("🔍 Testing Recipe Loading...")
+    total_count = stats.total
+    logger.info("✅ Loaded %d recipes total", total_count)
+    
+    prof_counts = stats.prof_counts
+    logger.info("📊 Recipes by profession:")
+    for prof, count in prof_counts.items():
+        logger.info("   %s: %d recipes", prof, count)
+    
+    # Test specific professions
+    success = len(prof_counts.keys() & EXPECTED_PROFS) >= 4
+    if success:
+        logger.info("✅ Multi-file recipe loading: SUCCESS")
+    else:
+        logger.error("❌ Multi-file recipe loading: FAILED")
+    return success, total_count, prof_counts
+
+def check_recipe_data_integrity(stats):
+    """Log invalid recipes; returns (success, valid_count, issues)"""
+    logger.info("\n🔍 Testing Recipe Data Integrity...")
+    issues = stats.issues
+    valid_recipes = stats.valid
+    logger.info("✅ Valid recipes: %d/%d", valid_recipes, stats.total)
+    
+    if issues:
+        logger.warning("⚠️ Issues found:")
+        for i, name in issues[:5]:  # Show first 5 issues
+            logger.warning("   Recipe %d (%s): invalid", i, name)
+        if len(issues) > 5:
+            logger.warning("   ... and %d more issues", len(issues)-5)
+    else:
+        logger.info("✅ All recipes have valid data structure")
+    return len(issues) == 0, valid_recipes, issues
+
+def check_price_data(stats):
+    """Log price coverage; returns (success, with_prices, without_prices)"""
+    logger.info("\n🔍 Testing Price Data...")
+    recipes_with_prices = stats.with_prices
+    recipes_without_prices = stats.without_prices
+    logger.info("✅ Recipes with price data: %d", recipes_with_prices)
+    logger.warning("⚠️ Recipes without price data: %d", recipes_without_prices)
+    
+    total = stats.total
+    if total:
+        logger.info("📊 Price data coverage: %.1f%%", recipes_with_prices * 100 / total)
+    
+    # Integer comparison for "more than half have prices"
+    return recipes_with_prices * 2 > total, recipes_with_prices, recipes_without_prices
+
+def check_player_persistence(save_dir: Path) -> bool:
+    """Save a player under save_dir, reload it in a new instance and compare"""
+    logger.info("\n🔍 Testing Player Data Persistence...")
+    from data.enums import Profession, ToolType
+    from data.player import Player
+    
+    def make_player():
+        player = Player()
+        player.save_path = save_dir / "player.json"
+        player.journal_path = player.save_path.with_suffix(".journal")
+        player.storage_system.save_path = save_dir / "storage.json"
+        return player
+    
+    # Set test values
+    test_skill = 42
+    test_tool = 33
+    player = make_player()
+    player.load()
+    player.skills[Profession.WEAPONSMITH] = test_skill
+    player.tools[ToolType.FORGE] = test_tool
+    player.tool_types[Profession.WEAPONSMITH] = "Advanced"
+    player.save()
+    logger.info("✅ Player data saved")
+    
+    # Load new instance, bypassing the decoded-state cache
+    Player._CACHE.pop(str(player.save_path), None)
+    player2 = make_player()
+    player2.load()
+    
+    loaded_skill = player2.skills[Profession.WEAPONSMITH]
+    loaded_tool = player2.tools[ToolType.FORGE]
+    loaded_tool_type = player2.tool_types[Profession.WEAPONSMITH]
+    
+    skill_match = loaded_skill == test_skill
+    tool_match = loaded_tool == test_tool
+    tool_type_match = loaded_tool_type == "Advanced"
+    
+    logger.info("✅ Skill persistence: %s (%s == %s)", skill_match, loaded_skill, test_skill)
+    logger.info("✅ Tool persistence: %s (%s == %s)", tool_match, loaded_tool, test_tool)
+    logger.info("✅ Tool type persistence: %s (%s == Advanced)", tool_type_match, loaded_tool_type)
+    return skill_match and tool_match and tool_type_match
+
+def test_recipe_loading(recipe_stats):
+    """Test multi-file recipe loading"""
+    success, _, prof_counts = check_recipe_loading(recipe_stats)
+    assert success, f"expected at least 4 of {sorted(EXPECTED_PROFS)}, got {sorted(prof_counts)}"
+
+def test_recipe_data_integrity(recipe_stats):
+    """Test recipe data integrity"""
+    success, _, issues = check_recipe_data_integrity(recipe_stats)
+    assert success, f"invalid recipes (index, name): {issues[:5]}"
+
+@pytest.mark.xfail(reason="most recipe files do not carry material/output prices yet")
+def test_price_data(recipe_stats):
+    """Test price data availability"""
+    success, with_prices, without_prices = check_price_data(recipe_stats)
+    assert success, f"{with_prices} recipes with prices, {without_prices} without"
+
+def test_player_persistence(tmp_path):
+    """Test player data persistence"""
+    assert check_player_persistence(tmp_path)
+
+def main():
+    """Run all functionality tests"""
+    logger.info("🎯 QUINFALL COMPANION - FUNCTIONALITY TEST")
+    logger.info("=" * 50)
+    
+    results = {}
+    
+    from ui.crafting_tab import load_recipes
+    stats = collect_recipe_stats(load_recipes())
+    
+    # Test 1: Recipe Loading
+    recipe_success, total_recipes, prof_counts = check_recipe_loading(stats)
+    results['recipe_loading'] = recipe_success
+    
+    # Test 2: Recipe Data Integrity
+    integrity_success, valid_recipes, issues = check_recipe_data_integrity(stats)
+    results['data_integrity'] = integrity_success
+    
+    # Test 3: Price Data
+    price_success, with_prices, without_prices = check_price_data(stats)
+    results['price_data'] = price_success
+    
+    # Test 4: Player Persistence
+    with tempfile.TemporaryDirectory() as save_dir:
+        persistence_success = check_player_persistence(Path(save_dir))
+    results['persistence'] = persistence_success
+    
+    # Final Report
+    logger.info("\n" + "=" * 50)
+    logger.info("📊 FINAL FUNCTIONALITY REPORT")
+    logger.info("=" * 50)
+    
+    passed = sum(1 for success in results.values() if success)
+    total = len(results)
+    
+    logger.info("Tests Passed: %d/%d", passed, total)
+    logger.info("Success Rate: %.1f%%", (passed/total)*100)
+    
+    logger.info("\nDetailed Results:")
+    for test_name, success in results.items():
+        status = "✅ PASS" if success else "❌ FAIL"
+        logger.info("  %s: %s", status, test_name)
+    
+    # Key Metrics
+    logger.info("\n📈 Key Metrics:")
+    logger.info("  Total Recipes: %d", total_recipes)
+    logger.info("  Valid Recipes: %d", valid_recipes)
+    logger.info("  Professions: %d", len(prof_counts))
+    logger.info("  Recipes with Prices: %d", with_prices)
+
+    # Conclusion
+    if passed == total:
+        logger.info("\n🎉 ALL FUNCTIONALITY TESTS PASSED!")
+        logger.info("✅ Multi-file recipe loading works")
+        logger.info("✅ Recipe data integrity is good")
+        logger.info("✅ Price data is available")
+        logger.info("✅ Player persistence works")
+        logger.info("\n🚀 READY TO PROCEED:")
+        logger.info("   1. Add more crafting professions")
+        logger.info("   2. Implement gathering system")
+        logger.info("   3. Add specialization tracking")
+        logger.info("   4. Implement API sync")
+        logger.info("   5. Add proper logging")
+        return True
+    else:
+        logger.info("\n⚠️ %d TESTS FAILED", total-passed)
+        logger.info("Review issues above before proceeding")
+        return False
+
+if __name__ == "__main__":
+    # conftest.py sets up the path under pytest; do the same for script runs
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    success = main()
+    sys.exit(0 if success else 1)
@@ -1,19 +1,48 @@
 import os
 import shutil
+import sys
 from pathlib import Path
 
+FICLONE = 0x40049409  # linux/fs.h: reflink dst to src
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy file contents via reflink or sendfile, falling back to shutil"""
+    if sys.platform.startswith("linux"):
+        import fcntl
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                return
+            except OSError:
+                pass  # Filesystem without reflink support
+            try:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                offset = 0
+                while remaining > 0:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+                return
+            except OSError:
+                fdst.truncate(0)
+    shutil.copyfile(src, dst)
+
 def create_test_copy(original_path: str) -> str:
     """Creates a test copy of a file in the tests directory"""
     test_dir = Path("tests/temp_files")
     test_dir.mkdir(exist_ok=True)
-    
+
     original = Path(original_path)
     test_path = test_dir / f"test_{original.name}"
-    shutil.copy2(original, test_path)
+    _fast_copy(original, test_path)
+    shutil.copystat(original, test_path)
     return str(test_path)
 
 def update_original_if_passed(test_path: str, original_path: str) -> bool:
     """Updates original file if test passed"""
     # Add your test validation logic here
-    shutil.copy2(test_path, original_path)
+    _fast_copy(Path(test_path), Path(original_path))
+    shutil.copystat(test_path, original_path)
     return True
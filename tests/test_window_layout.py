@@ -1,9 +1,9 @@
 import unittest
-from PySide6.QtWidgets import QApplication, QScrollArea
+import pytest
+from PySide6.QtWidgets import QScrollArea
 from main import CompanionApp
 
-app = QApplication([])
-
+@pytest.mark.usefixtures("qapp")
 class TestWindowLayout(unittest.TestCase):
     def test_minimum_size(self):
         window = CompanionApp()
@@ -6,80 +6,185 @@ Allows users to configure API credentials and sync settings
 
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, 
                                QLineEdit, QPushButton, QLabel, QCheckBox, 
-                               QSpinBox, QGroupBox, QTextEdit, QTabWidget,
-                               QWidget, QMessageBox, QProgressBar)
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
+                               QSpinBox, QGroupBox, QPlainTextEdit, QTabWidget,
+                               QWidget, QMessageBox, QProgressBar, QButtonGroup)
+from PySide6.QtCore import (Qt, QObject, QRunnable, QThreadPool, Signal, QTimer,
+                            QCoreApplication, QFileSystemWatcher)
 from PySide6.QtGui import QFont, QPixmap, QIcon
-import json
+import time
+from collections import deque
 from pathlib import Path
 import logging
+from utils import json_io
+from utils.credentials import APICredentials, save_credentials
 
 logger = logging.getLogger(__name__)
 
-class APITestThread(QThread):
-    """Thread for testing API connection without blocking UI"""
+API_SETTINGS_FILE = Path("saves/api_settings.json")
+
+DEFAULT_API_SETTINGS = {
+    'server_url': 'https://api.thequinfall.com/v1',
+    'timeout': 30,
+    'auto_sync_enabled': True,
+    'sync_interval': 5,
+    'sync_on_startup': True,
+    'sync_on_shutdown': True,
+    'prefer_server': True,
+    'enable_cache': True,
+    'cache_duration': 60
+}
+
+# Last parsed settings file, reused while its mtime is unchanged
+_SETTINGS_CACHE = {"mtime": None, "data": None}
+_settings_watcher = None  # QFileSystemWatcher, created once a Qt application exists
+
+def _invalidate_settings_cache(path=None):
+    """Drop the cached settings so the next read goes back to disk"""
+    _SETTINGS_CACHE["mtime"] = None
+    _SETTINGS_CACHE["data"] = None
+    _watch_settings_file()
+
+def _watch_settings_file():
+    """Watch the settings file, re-adding it after it is (re)created"""
+    global _settings_watcher
+    if _settings_watcher is None:
+        if QCoreApplication.instance() is None:
+            return
+        _settings_watcher = QFileSystemWatcher()
+        _settings_watcher.fileChanged.connect(_invalidate_settings_cache)
+    # Replaced files drop out of the watch list
+    if not _settings_watcher.files() and API_SETTINGS_FILE.exists():
+        _settings_watcher.addPath(str(API_SETTINGS_FILE))
+
+def read_api_settings():
+    """Read saved API settings; returns None if no settings file could be read"""
+    if (_SETTINGS_CACHE["data"] is not None and _settings_watcher is not None
+            and _settings_watcher.files()):
+        return dict(_SETTINGS_CACHE["data"])
+    try:
+        if API_SETTINGS_FILE.exists():
+            mtime = API_SETTINGS_FILE.stat().st_mtime_ns
+            if _SETTINGS_CACHE["mtime"] != mtime:
+                _SETTINGS_CACHE["data"] = json_io.load_path(API_SETTINGS_FILE)
+                _SETTINGS_CACHE["mtime"] = mtime
+            _watch_settings_file()
+            return dict(_SETTINGS_CACHE["data"])
+    except Exception as e:
+        logger.warning(f"Could not load API settings: {e}")
+    return None
+
+class APITestSignals(QObject):
+    """Signals for APITestTask (QRunnable cannot emit signals itself)"""
     
     test_completed = Signal(bool, str)  # success, message
+
+class APITestTask(QRunnable):
+    """Pooled task for testing API connection without blocking UI"""
+    
+    _Client = None  # QuinfallAPIClient, resolved once on first construction
     
-    def __init__(self, username=None, password=None, api_key=None):
+    def __init__(self, credentials: APICredentials):
         super().__init__()
-        self.username = username
-        self.password = password
-        self.api_key = api_key
+        self.signals = APITestSignals()
+        self.credentials = credentials
+        if APITestTask._Client is None:
+            try:
+                from utils.quinfall_api import QuinfallAPIClient
+                APITestTask._Client = QuinfallAPIClient
+            except ImportError as e:
+                logger.warning(f"API client not available: {e}")
     
     def run(self):
+        test_completed = self.signals.test_completed
         try:
-            from utils.quinfall_api import QuinfallAPIClient
+            if self._Client is None:
+                test_completed.emit(False, "❌ API client not available")
+                return
             
-            client = QuinfallAPIClient()
+            client = self._Client()
             
-            if self.api_key:
-                success = client.authenticate(api_key=self.api_key)
+            creds = self.credentials
+            if creds.api_key:
+                success = client.authenticate(api_key=creds.api_key)
                 if success:
-                    self.test_completed.emit(True, "✅ API key authentication successful!")
+                    test_completed.emit(True, "✅ API key authentication successful!")
                 else:
-                    self.test_completed.emit(False, "❌ API key authentication failed")
-            elif self.username and self.password:
-                success = client.authenticate(self.username, self.password)
+                    test_completed.emit(False, "❌ API key authentication failed")
+            elif creds.username and creds.password:
+                success = client.authenticate(creds.username, creds.password)
                 if success:
-                    self.test_completed.emit(True, "✅ Username/password authentication successful!")
+                    test_completed.emit(True, "✅ Username/password authentication successful!")
                 else:
-                    self.test_completed.emit(False, "❌ Username/password authentication failed")
+                    test_completed.emit(False, "❌ Username/password authentication failed")
             else:
-                self.test_completed.emit(False, "❌ No credentials provided")
+                test_completed.emit(False, "❌ No credentials provided")
                 
         except Exception as e:
-            self.test_completed.emit(False, f"❌ Connection test failed: {str(e)}")
+            test_completed.emit(False, f"❌ Connection test failed: {str(e)}")
 
-class APISyncThread(QThread):
-    """Thread for performing API sync without blocking UI"""
+class APISyncSignals(QObject):
+    """Signals for APISyncTask"""
     
     sync_completed = Signal(bool, str)  # success, message
     sync_progress = Signal(str)  # progress message
+
+class APISyncTask(QRunnable):
+    """Pooled task for performing API sync without blocking UI"""
+    
+    PROGRESS_INTERVAL = 0.1  # Emit progress at most every 100 ms
     
     def __init__(self, storage_system):
         super().__init__()
+        self.signals = APISyncSignals()
         self.storage_system = storage_system
+        self._pending = []
+        self._last_emit = 0.0
+    
+    def _report(self, message, force=False):
+        """Queue a progress line, emitting the batch once the interval has passed"""
+        if message:
+            self._pending.append(message)
+        now = time.monotonic()
+        if self._pending and (force or now - self._last_emit >= self.PROGRESS_INTERVAL):
+            self.signals.sync_progress.emit("\n".join(self._pending))
+            self._pending.clear()
+            self._last_emit = now
     
     def run(self):
+        signals = self.signals
         try:
-            self.sync_progress.emit("🔄 Connecting to Quinfall API...")
+            self._report("🔄 Connecting to Quinfall API...")
             
             success, message = self.storage_system.sync_with_api()
             
+            self._report(None, force=True)
             if success:
-                self.sync_completed.emit(True, message)
+                signals.sync_completed.emit(True, message)
             else:
-                self.sync_completed.emit(False, message)
+                signals.sync_completed.emit(False, message)
                 
         except Exception as e:
-            self.sync_completed.emit(False, f"❌ Sync failed: {str(e)}")
+            self._report(None, force=True)
+            signals.sync_completed.emit(False, f"❌ Sync failed: {str(e)}")
 
 class APISettingsDialog(QDialog):
     """Dialog for configuring Quinfall API settings"""
     
-    def __init__(self, parent=None):
+    # (widget attribute, settings key, getter, setter); defaults live in DEFAULT_API_SETTINGS
+    _FIELDS = (
+        ("server_url_input", "server_url", lambda w: w.text().strip(), QLineEdit.setText),
+        ("timeout_input", "timeout", QSpinBox.value, QSpinBox.setValue),
+        ("auto_sync_enabled", "auto_sync_enabled", QCheckBox.isChecked, QCheckBox.setChecked),
+        ("sync_interval", "sync_interval", QSpinBox.value, QSpinBox.setValue),
+        ("sync_on_startup", "sync_on_startup", QCheckBox.isChecked, QCheckBox.setChecked),
+        ("sync_on_shutdown", "sync_on_shutdown", QCheckBox.isChecked, QCheckBox.setChecked),
+        ("enable_cache", "enable_cache", QCheckBox.isChecked, QCheckBox.setChecked),
+        ("cache_duration", "cache_duration", QSpinBox.value, QSpinBox.setValue),
+    )
+    
+    def __init__(self, parent=None, storage_system=None):
         super().__init__(parent)
+        self._storage_system = storage_system
         self.setWindowTitle("Quinfall API Settings")
         self.setFixedSize(500, 600)
         self.setModal(True)
@@ -90,9 +195,17 @@ class APISettingsDialog(QDialog):
         self.init_ui()
         self.load_current_settings()
         
-        # Test thread
-        self.test_thread = None
-        self.sync_thread = None
+        # Background tasks run on the shared pool; the signal holders are kept
+        # on self so they outlive the runnables. Flags are only touched on the
+        # GUI thread, so plain bools guard reentry.
+        self.test_signals = None
+        self.sync_signals = None
+        self._test_running = False
+        self._sync_running = False
+        
+        # Result lines waiting for the next coalesced repaint
+        self._log_buffer = deque()
+        self._flush_pending = False
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -236,8 +349,10 @@ class APISettingsDialog(QDialog):
         conflict_layout.addRow("", self.prefer_local)
         
         # Make checkboxes mutually exclusive
-        self.prefer_server.toggled.connect(lambda checked: self.prefer_local.setChecked(not checked) if checked else None)
-        self.prefer_local.toggled.connect(lambda checked: self.prefer_server.setChecked(not checked) if checked else None)
+        self.conflict_group = QButtonGroup(conflict_group)
+        self.conflict_group.setExclusive(True)
+        self.conflict_group.addButton(self.prefer_server)
+        self.conflict_group.addButton(self.prefer_local)
         
         layout.addWidget(conflict_group)
         
@@ -283,8 +398,9 @@ class APISettingsDialog(QDialog):
         results_group = QGroupBox("📋 Test Results")
         results_layout = QVBoxLayout(results_group)
         
-        self.results_text = QTextEdit()
+        self.results_text = QPlainTextEdit()
         self.results_text.setMaximumHeight(150)
+        self.results_text.setMaximumBlockCount(1000)
         self.results_text.setPlaceholderText("Connection test results will appear here...")
         results_layout.addWidget(self.results_text)
         
@@ -301,8 +417,9 @@ class APISettingsDialog(QDialog):
         self.manual_sync_button.clicked.connect(self.manual_sync)
         sync_layout.addWidget(self.manual_sync_button)
         
-        self.sync_results = QTextEdit()
+        self.sync_results = QPlainTextEdit()
         self.sync_results.setMaximumHeight(100)
+        self.sync_results.setMaximumBlockCount(1000)
         self.sync_results.setPlaceholderText("Sync results will appear here...")
         sync_layout.addWidget(self.sync_results)
         
@@ -313,51 +430,41 @@ class APISettingsDialog(QDialog):
     
     def _load_settings(self):
         """Load API settings from file"""
-        try:
-            settings_file = Path("saves/api_settings.json")
-            if settings_file.exists():
-                with open(settings_file, 'r') as f:
-                    return json.load(f)
-        except Exception as e:
-            logger.warning(f"Could not load API settings: {e}")
-        
-        # Default settings
-        return {
-            'server_url': 'https://api.thequinfall.com/v1',
-            'timeout': 30,
-            'auto_sync_enabled': True,
-            'sync_interval': 5,
-            'sync_on_startup': True,
-            'sync_on_shutdown': True,
-            'prefer_server': True,
-            'enable_cache': True,
-            'cache_duration': 60
-        }
+        settings = read_api_settings()
+        return settings if settings is not None else dict(DEFAULT_API_SETTINGS)
+    
+    def reload_settings(self):
+        """Refresh the widgets from the saved settings before the dialog is reopened"""
+        self.settings = self._load_settings()
+        self.load_current_settings()
+    
+    def hideEvent(self, event):
+        """Drop typed credentials when the dialog closes; it is kept for reuse"""
+        self.api_key_input.clear()
+        self.password_input.clear()
+        super().hideEvent(event)
     
     def load_current_settings(self):
         """Load current settings into UI"""
-        self.server_url_input.setText(self.settings.get('server_url', ''))
-        self.timeout_input.setValue(self.settings.get('timeout', 30))
-        self.auto_sync_enabled.setChecked(self.settings.get('auto_sync_enabled', True))
-        self.sync_interval.setValue(self.settings.get('sync_interval', 5))
-        self.sync_on_startup.setChecked(self.settings.get('sync_on_startup', True))
-        self.sync_on_shutdown.setChecked(self.settings.get('sync_on_shutdown', True))
-        self.prefer_server.setChecked(self.settings.get('prefer_server', True))
-        self.prefer_local.setChecked(not self.settings.get('prefer_server', True))
-        self.enable_cache.setChecked(self.settings.get('enable_cache', True))
-        self.cache_duration.setValue(self.settings.get('cache_duration', 60))
+        for attr, key, _, setter in self._FIELDS:
+            setter(getattr(self, attr), self.settings.get(key, DEFAULT_API_SETTINGS[key]))
+        prefer_server = self.settings.get('prefer_server', DEFAULT_API_SETTINGS['prefer_server'])
+        (self.prefer_server if prefer_server else self.prefer_local).setChecked(True)
+    
+    def _entered_credentials(self):
+        """Stripped api_key/username/password from the credential fields"""
+        return APICredentials(*(getattr(self, f"{key}_input").text().strip()
+                                for key in ("api_key", "username", "password")))
     
     def test_connection(self):
         """Test API connection"""
-        if self.test_thread and self.test_thread.isRunning():
+        if self._test_running:
             return
         
         # Get credentials
-        api_key = self.api_key_input.text().strip()
-        username = self.username_input.text().strip()
-        password = self.password_input.text().strip()
+        creds = self._entered_credentials()
         
-        if not api_key and not (username and password):
+        if not creds.is_complete():
             QMessageBox.warning(self, "No Credentials", 
                               "Please enter either an API key or username/password.")
             return
@@ -365,16 +472,22 @@ class APISettingsDialog(QDialog):
         # Update UI
         self.status_label.setText("🔄 Testing connection...")
         self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # Indeterminate
+        # Static bar; indeterminate mode keeps repainting while the test runs
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("Testing...")
         self.test_button.setEnabled(False)
         
-        # Start test thread
-        self.test_thread = APITestThread(username, password, api_key)
-        self.test_thread.test_completed.connect(self._on_test_completed)
-        self.test_thread.start()
+        # Start test task
+        task = APITestTask(creds)
+        self.test_signals = task.signals
+        self.test_signals.test_completed.connect(self._on_test_completed)
+        self._test_running = True
+        QThreadPool.globalInstance().start(task)
     
     def _on_test_completed(self, success, message):
         """Handle test completion"""
+        self._test_running = False
         self.progress_bar.setVisible(False)
         self.test_button.setEnabled(True)
         
@@ -385,33 +498,58 @@ class APISettingsDialog(QDialog):
             self.status_label.setText("❌ Connection failed")
             self.status_label.setStyleSheet("color: red; font-weight: bold; padding: 10px;")
         
-        self.results_text.append(f"{message}\n")
+        self._queue_log(self.results_text, message)
+    
+    def _queue_log(self, target, message):
+        """Buffer a result line; lines are flushed together every 100 ms"""
+        self._log_buffer.append((target, message))
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(100, self._flush_logs)
+    
+    def _flush_logs(self):
+        """Append all buffered lines with one append() per target widget"""
+        self._flush_pending = False
+        batches = {}
+        while self._log_buffer:
+            target, message = self._log_buffer.popleft()
+            batches.setdefault(target, []).append(message)
+        for target, lines in batches.items():
+            target.appendPlainText("\n".join(lines))
     
     def manual_sync(self):
         """Perform manual storage sync"""
-        if not hasattr(self.parent(), 'player') or not self.parent().player:
-            QMessageBox.warning(self, "No Player Data", 
-                              "Player data not available for sync.")
-            return
-        
-        if self.sync_thread and self.sync_thread.isRunning():
+        storage_system = self._storage_system
+        if storage_system is None:
+            # Fall back to the parent's player for callers that don't inject it
+            player = getattr(self.parent(), 'player', None)
+            if not player:
+                QMessageBox.warning(self, "No Player Data", 
+                                  "Player data not available for sync.")
+                return
+            storage_system = player.storage_system
+        
+        if self._sync_running:
             return
         
         # Update UI
         self.manual_sync_button.setEnabled(False)
-        self.sync_results.append("🔄 Starting manual sync...\n")
-        
-        # Start sync thread
-        storage_system = self.parent().player.storage_system
-        self.sync_thread = APISyncThread(storage_system)
-        self.sync_thread.sync_progress.connect(lambda msg: self.sync_results.append(f"{msg}\n"))
-        self.sync_thread.sync_completed.connect(self._on_sync_completed)
-        self.sync_thread.start()
+        self._queue_log(self.sync_results, "🔄 Starting manual sync...")
+        
+        # Start sync task
+        task = APISyncTask(storage_system)
+        self.sync_signals = task.signals
+        self.sync_signals.sync_progress.connect(
+            lambda msg: self._queue_log(self.sync_results, msg), Qt.QueuedConnection)
+        self.sync_signals.sync_completed.connect(self._on_sync_completed, Qt.QueuedConnection)
+        self._sync_running = True
+        QThreadPool.globalInstance().start(task)
     
     def _on_sync_completed(self, success, message):
         """Handle sync completion"""
+        self._sync_running = False
         self.manual_sync_button.setEnabled(True)
-        self.sync_results.append(f"{message}\n")
+        self._queue_log(self.sync_results, message)
         
         if success:
             QMessageBox.information(self, "Sync Complete", message)
@@ -422,42 +560,19 @@ class APISettingsDialog(QDialog):
         """Save API settings"""
         try:
             # Collect settings
-            settings = {
-                'server_url': self.server_url_input.text().strip(),
-                'timeout': self.timeout_input.value(),
-                'auto_sync_enabled': self.auto_sync_enabled.isChecked(),
-                'sync_interval': self.sync_interval.value(),
-                'sync_on_startup': self.sync_on_startup.isChecked(),
-                'sync_on_shutdown': self.sync_on_shutdown.isChecked(),
-                'prefer_server': self.prefer_server.isChecked(),
-                'enable_cache': self.enable_cache.isChecked(),
-                'cache_duration': self.cache_duration.value()
-            }
-            
-            # Save to file
-            settings_file = Path("saves/api_settings.json")
-            settings_file.parent.mkdir(exist_ok=True)
+            settings = {key: getter(getattr(self, attr))
+                        for attr, key, getter, _ in self._FIELDS}
+            settings['prefer_server'] = self.prefer_server.isChecked()
             
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            # Save to file (saves/ is created at startup)
+            json_io.dump_path(API_SETTINGS_FILE, settings, indent=True)
+            _invalidate_settings_cache()
             
             # Save credentials separately (more secure)
-            api_key = self.api_key_input.text().strip()
-            username = self.username_input.text().strip()
-            password = self.password_input.text().strip()
+            creds = self._entered_credentials()
             
-            if api_key or (username and password):
-                creds = {}
-                if api_key:
-                    creds['api_key'] = api_key
-                if username:
-                    creds['username'] = username
-                if password:
-                    creds['password'] = password
-                
-                creds_file = Path("saves/api_credentials.json")
-                with open(creds_file, 'w') as f:
-                    json.dump(creds, f, indent=2)
+            if creds.is_complete():
+                save_credentials(creds.as_dict())
             
             QMessageBox.information(self, "Settings Saved", 
                                   "API settings saved successfully!")
@@ -3,14 +3,22 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                                      QComboBox, QSlider, QPushButton, QTextEdit, 
                                      QSpinBox, QGroupBox, QScrollArea, QFrame,
                                      QToolTip, QSizePolicy, QButtonGroup, QRadioButton,
-                                     QGridLayout)
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QPixmap, QIcon
+                                     QGridLayout, QApplication)
+from PySide6.QtCore import Qt, QTimer, QSize, QRunnable, QThreadPool, QSignalBlocker
+from PySide6.QtGui import QPixmap, QIcon, QPainter
 from utils.icon_manager import icon_manager
+from utils import json_io
 from data.enums import Profession, Recipe, ToolType, ProfessionTier, ProfessionCategory
 from data.player import Player
 from typing import List
+import functools
+from array import array
+from bisect import bisect_right
 import json
+import os
+import pickle
+import threading
+from itertools import chain
 from pathlib import Path
 from ui.notifications import RecipeUpdateNotifier
 import logging
@@ -29,6 +37,32 @@ CRAFTING_PROFESSIONS = [
     Profession.WOODWORKING
 ]
 
+_US_TO_SPACE = str.maketrans('_', ' ')
+
+# Combo box text -> Profession, so signal handlers skip string work + Enum lookup
+_TEXT_TO_PROF = {p.name.translate(_US_TO_SPACE): p for p in CRAFTING_PROFESSIONS}
+
+# Emoji per profession, resolved once instead of per button redraw
+_PROF_ICONS = {p: icon_manager.get_profession_icon(p.name.lower()) for p in Profession}
+
+_RECIPE_ICON_SIZE = QSize(16, 16)
+
+_STATUS_OK = "✅"
+_STATUS_BAD = "❌"
+
+@functools.lru_cache(maxsize=None)
+def _profession_qicon(profession) -> QIcon:
+    """Profession glyph painted once into a shared QIcon (needs a running QApplication)"""
+    pixmap = QPixmap(32, 32)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    font = painter.font()
+    font.setPixelSize(24)
+    painter.setFont(font)
+    painter.drawText(pixmap.rect(), Qt.AlignCenter, _PROF_ICONS[profession])
+    painter.end()
+    return QIcon(pixmap)
+
 RECIPE_FILES = {
     'weaponsmith': Path(__file__).parent.parent / 'data' / 'recipes_weaponsmith.json',
     'armorsmith': Path(__file__).parent.parent / 'data' / 'recipes_armorsmith.json',
@@ -38,60 +72,279 @@ RECIPE_FILES = {
     'alchemy': Path(__file__).parent.parent / 'data' / 'recipes_alchemy.json'
 }
 
-def load_recipes() -> List[Recipe]:
-    """Load recipes from all profession JSON files"""
-    all_recipes = []
+# Decoded recipe JSON, one pickle sidecar per profession keyed by its file's mtime/size
+RECIPE_CACHE_DIR = Path(__file__).parent.parent / 'data'
+_RECIPE_CACHE_LOCK = threading.Lock()  # Serializes sidecar writes
+
+# Profession member by name, skipping Enum name resolution per recipe row
+_PROF_CACHE = {p.name: p for p in Profession}
+
+# Choices offered by the price count selector
+PRICE_COUNTS = (5, 10, 25, 50)
+
+def _window_average(history, count: int) -> float:
+    """Mean of the first count entries of a price history"""
+    window = history[:count]
+    return sum(window) / len(window)
+
+class RecipeRow:
+    """One recipe as loaded from the profession JSON files"""
+    __slots__ = ('name', 'profession', 'skill_level', 'materials', 'tool_level', 'weight',
+                 'base_price', 'craft_time', 'source', 'material_prices', 'output_prices',
+                 'avg_material_prices', 'avg_output', 'profit')
+    
+    def __init__(self, name, profession, skill_level, materials, tool_level=1, weight=1.0,
+                 base_price=0, craft_time=60, source='Unknown', material_prices=None,
+                 output_prices=None):
+        self.name = name
+        self.profession = profession
+        self.skill_level = skill_level
+        self.materials = materials
+        self.tool_level = tool_level
+        self.weight = weight
+        self.base_price = base_price
+        self.craft_time = craft_time
+        self.source = source
+        self.material_prices = material_prices
+        self.output_prices = output_prices
+        # Price averages per PRICE_COUNTS entry, so redraws only look them up
+        self.avg_material_prices = {
+            n: {mat: _window_average(history, n) for mat, history in material_prices.items() if history}
+            for n in PRICE_COUNTS
+        } if material_prices else None
+        self.avg_output = {
+            n: _window_average(output_prices, n) for n in PRICE_COUNTS
+        } if output_prices else None
+        self.profit = {
+            n: self.avg_output[n] - _material_cost(self, n) for n in PRICE_COUNTS
+        } if material_prices and output_prices else None
+
+def _material_cost(recipe, price_count: int) -> float:
+    """Sum of average material prices over the last price_count entries"""
+    averages = recipe.avg_material_prices[price_count]
+    return sum(averages[mat] * qty for mat, qty in recipe.materials.items() if mat in averages)
+
+@functools.lru_cache(maxsize=None)
+def _profit_text(recipe, price_count: int) -> str:
+    """Profit line for a priced recipe; memoized per (recipe, price_count)"""
+    profit = recipe.profit[price_count]
     
-    for profession_name, recipe_file in RECIPE_FILES.items():
+    profit_text = f"Profit: {profit:.1f}g" if profit > 0 else f"Loss: {abs(profit):.1f}g"
+    return f"💰 {profit_text}"
+
+# Difficulty bucket per required skill level (0-100), matched by _RECIPE_BTN_QSS
+_SKILL_BUCKET = tuple(
+    "easy" if level <= 10 else "medium" if level <= 30 else "hard" if level <= 60 else "expert"
+    for level in range(101)
+)
+
+# Applied once to the recipe container; buttons only switch their skill property
+_RECIPE_BTN_QSS = """
+    QPushButton#recipeBtn {
+        text-align: left;
+        padding: 10px;
+        border: 2px solid #666;
+        border-radius: 6px;
+        background-color: #2a2a2a;
+        font-size: 11px;
+        font-weight: bold;
+        min-height: 60px;
+    }
+    QPushButton#recipeBtn[skill="easy"] { color: #4ade80; }
+    QPushButton#recipeBtn[skill="medium"] { color: #fbbf24; }
+    QPushButton#recipeBtn[skill="hard"] { color: #fb923c; }
+    QPushButton#recipeBtn[skill="expert"] { color: #f87171; }
+    QPushButton#recipeBtn:hover {
+        background-color: #3a3a3a;
+        border-color: #4a90e2;
+    }
+    QPushButton#recipeBtn:checked {
+        background-color: #4a90e2;
+        border-color: #60a5fa;
+        color: white;
+    }
+"""
+
+def _recipe_file_stamp(recipe_file: Path):
+    """(mtime_ns, size) of a recipe file, or None if it cannot be stat'ed"""
+    try:
+        stat = recipe_file.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+def _recipe_cache_file(profession_name: str) -> Path:
+    return RECIPE_CACHE_DIR / f'.recipes-{profession_name}.cache'
+
+def _read_recipe_cache(profession_name: str):
+    """Sidecar contents for one profession: (file stamp, decoded JSON), or None"""
+    try:
+        with open(_recipe_cache_file(profession_name), 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable {profession_name} recipe cache: {e}")
+    return None
+
+def _write_recipe_cache(profession_name: str, entry):
+    cache_file = _recipe_cache_file(profession_name)
+    tmp = cache_file.with_suffix('.tmp')
+    with _RECIPE_CACHE_LOCK:
         try:
-            if not recipe_file.exists():
-                logger.debug(f"Recipe file not found: {recipe_file}")
-                continue
-                
-            with open(recipe_file, 'r') as f:
-                data = json.load(f)
-                recipes = []
-                logger.debug(f"Loading {len(data['recipes'])} {profession_name} recipes from JSON")
+            with open(tmp, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write {profession_name} recipe cache: {e}")
+            tmp.unlink(missing_ok=True)
+
+def _load_recipe_payload(profession_name: str, stamp):
+    """Decoded JSON for one profession, read from its pickle sidecar when it is current"""
+    entry = _read_recipe_cache(profession_name)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    data = json_io.load_path(RECIPE_FILES[profession_name])
+    _write_recipe_cache(profession_name, (stamp, data))
+    return data
+
+@functools.lru_cache(maxsize=32)
+def _load_profession(profession_name: str, stamp):
+    """Parse one recipe file into (recipes sorted by (skill_level, name), skill levels)
+
+    stamp only keys the cache, so an edited file is parsed again.
+    """
+    _profit_text.cache_clear()  # Fresh recipe objects, drop stale profit lines
+    recipes = []
+    if stamp is None:
+        logger.debug(f"Recipe file not found: {RECIPE_FILES[profession_name]}")
+        return (), array('H')
+    
+    try:
+        data = _load_recipe_payload(profession_name, stamp)
+        logger.debug("Loading %d %s recipes from JSON", len(data['recipes']), profession_name)
+        
+        for i, item in enumerate(data['recipes']):
+            try:
+                recipe = RecipeRow(
+                    item['recipe_name'],
+                    _PROF_CACHE[item['profession'].upper()],
+                    item['skill_level'],
+                    item['materials'],
+                    item.get('tool_level', 1),
+                    item.get('weight', 1.0),
+                    item.get('base_price', 0),
+                    item.get('craft_time', 60),
+                    item.get('source', 'Unknown'),
+                    item.get('material_prices'),
+                    item.get('output_prices'),
+                )
                 
-                for i, item in enumerate(data['recipes']):
-                    try:
-                        # Create a simple recipe object with required attributes
-                        recipe = type('Recipe', (), {
-                            'name': item['recipe_name'],
-                            'profession': Profession[item['profession'].upper()],
-                            'skill_level': item['skill_level'],
-                            'materials': item['materials'],
-                            'tool_level': item.get('tool_level', 1),
-                            'weight': item.get('weight', 1.0),
-                            'base_price': item.get('base_price', 0),
-                            'craft_time': item.get('craft_time', 60),
-                            'source': item.get('source', 'Unknown')
-                        })()
-                        
-                        # Add price data if available
-                        if 'material_prices' in item:
-                            recipe.material_prices = item['material_prices']
-                        if 'output_prices' in item:
-                            recipe.output_prices = item['output_prices']
-                        
-                        recipes.append(recipe)
-                        logger.debug(f"Loaded {profession_name} recipe {i+1}: {recipe.name} (Skill: {recipe.skill_level})")
-                        
-                    except Exception as recipe_error:
-                        logger.error(f"Error loading {profession_name} recipe {i+1}: {recipe_error}")
-                        continue
-                        
-                all_recipes.extend(recipes)
-                logger.debug(f"Successfully loaded {len(recipes)} {profession_name} recipes")
+                recipes.append(recipe)
+                logger.debug("Loaded %s recipe %d: %s (Skill: %d)",
+                             profession_name, i + 1, recipe.name, recipe.skill_level)
                 
-        except Exception as e:
-            logger.error(f"Error loading {profession_name} recipes file: {e}")
-            continue
+            except Exception as recipe_error:
+                logger.error(f"Error loading {profession_name} recipe {i+1}: {recipe_error}")
+                continue
+        
+        logger.debug("Successfully loaded %d %s recipes", len(recipes), profession_name)
+        
+    except Exception as e:
+        logger.error(f"Error loading {profession_name} recipes file: {e}")
     
-    logger.debug(f"Total recipes loaded: {len(all_recipes)}")
+    recipes.sort(key=lambda r: (r.skill_level, r.name))
+    # Parallel skill levels as a compact unsigned array, for bisecting the skill cut-off
+    return tuple(recipes), array('H', (r.skill_level for r in recipes))
+
+def _profession_recipes(profession):
+    profession_name = profession.name.lower()
+    if profession_name not in RECIPE_FILES:
+        return (), array('H')
+    return _load_profession(profession_name, _recipe_file_stamp(RECIPE_FILES[profession_name]))
+
+def get_recipes_for(profession) -> List[Recipe]:
+    """Recipes of one profession sorted by (skill_level, name); its file is read on first use"""
+    return list(_profession_recipes(profession)[0])
+
+def load_recipes() -> List[Recipe]:
+    """Load recipes from all profession JSON files
+
+    Parsed recipes are reused until one of the files changes on disk.
+    """
+    # Serial on purpose: the files are small and unpickling/decoding holds the GIL, so
+    # a thread pool measured 2-3x slower than this loop, cold or from the sidecars
+    all_recipes = list(chain.from_iterable(
+        _load_profession(name, _recipe_file_stamp(path))[0] for name, path in RECIPE_FILES.items()))
+    logger.debug("Total recipes loaded: %d", len(all_recipes))
     return all_recipes
 
-CRAFTING_RECIPES = load_recipes()
+def __getattr__(name):
+    # CRAFTING_RECIPES is built on first access instead of at import
+    if name == "CRAFTING_RECIPES":
+        return load_recipes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _recipe_count_up_to(profession, skill_level) -> int:
+    """Number of profession recipes available at skill_level"""
+    return bisect_right(_profession_recipes(profession)[1], skill_level)
+
+def _recipes_up_to(profession, skill_level) -> tuple:
+    """Recipes of profession with skill_level at most skill_level, in (skill_level, name) order"""
+    recipes, skill_levels = _profession_recipes(profession)
+    return recipes[:bisect_right(skill_levels, skill_level)]
+
+_SAVES_DIR = Path(__file__).resolve().parent.parent / 'saves'
+_PREFS_PATH = _SAVES_DIR / 'ui_preferences.json'
+
+# Parsed preference files: path -> (st_mtime_ns, prefs dict)
+_PREFS_CACHE = {}
+# Preferences saved but not yet on disk, served to readers in the meantime
+_PENDING_PREFS = {}
+_PREFS_WRITE_LOCK = threading.Lock()
+# Own single-thread pool so quitting can wait for prefs writes without
+# also blocking on API requests queued on the global pool
+_PREFS_POOL = QThreadPool()
+_PREFS_POOL.setMaxThreadCount(1)
+
+def _read_prefs(prefs_file: Path) -> dict:
+    """Preferences from prefs_file, re-parsed only when its mtime changes ({} if missing)"""
+    pending = _PENDING_PREFS.get(prefs_file)
+    if pending is not None:
+        return pending
+    try:
+        mtime = os.stat(prefs_file).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    cached = _PREFS_CACHE.get(prefs_file)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, json_io.load_path(prefs_file))
+        _PREFS_CACHE[prefs_file] = cached
+    return cached[1]
+
+def _write_prefs(prefs_file: Path, prefs: dict):
+    """Atomically write prefs and move them from the pending map into the read cache"""
+    with _PREFS_WRITE_LOCK:
+        try:
+            json_io.dump_path(prefs_file, prefs, indent=True)
+            _PREFS_CACHE[prefs_file] = (os.stat(prefs_file).st_mtime_ns, prefs)
+        except OSError as e:
+            logger.error(f"Error saving preferences: {e}")
+        finally:
+            # A newer save may have replaced the pending entry meanwhile
+            if _PENDING_PREFS.get(prefs_file) is prefs:
+                del _PENDING_PREFS[prefs_file]
+
+class PrefsWriteTask(QRunnable):
+    """Pooled task that writes UI preferences off the UI thread"""
+    
+    def __init__(self, prefs_file: Path, prefs: dict):
+        super().__init__()
+        self.prefs_file = prefs_file
+        self.prefs = prefs
+    
+    def run(self):
+        _write_prefs(self.prefs_file, self.prefs)
 
 class CraftingTab(BaseTab):
     def __init__(self, player=None):
@@ -102,7 +355,12 @@ class CraftingTab(BaseTab):
         self.current_page = 1
         self.recipes_per_page = 10
         self.selected_recipe = None  # Track currently selected recipe
-        self.recipe_buttons = []  # Track recipe buttons for selection
+        self._recipes_dirty = True  # Recipe list needs a rebuild on next show
+        self._mat_status_sig = None  # What material_status_label currently shows
+        self.recipe_buttons = []  # Pooled recipe buttons, reused across pages
+        self._button_recipes = []  # Recipe shown by each pooled button (None if hidden)
+        self._recipe_buttons = {}  # Recipe name -> pooled button showing it on this page
+        self._checked_recipe_name = None  # Name of the recipe whose button is checked
         self.player = player if player else Player()
         if not player:
             self.player.load()
@@ -110,21 +368,41 @@ class CraftingTab(BaseTab):
         self.setup_ui()
         
     def setup_ui(self):
+        # Coalesce slider-driven saves into one write once input settles
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_player_save)
+        self._player_dirty = False  # Unsaved player changes pending
+        # Preference writes are coalesced the same way
+        self._prefs_timer = QTimer(self)
+        self._prefs_timer.setSingleShot(True)
+        self._prefs_timer.setInterval(500)
+        self._prefs_timer.timeout.connect(self._flush_prefs)
+        # Rebuild the recipe list once per slider burst rather than per step
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self._refresh_recipes)
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.flush_pending_save)
+        
         self.layout = QVBoxLayout()
         
         # Profession selection
         self.profession_select = QComboBox()
-        self.profession_select.addItems([
-            p.name.replace('_', ' ')
-            for p in CRAFTING_PROFESSIONS
-        ])
+        self.profession_select.addItems(list(_TEXT_TO_PROF))
+        # Resolved once per selection change; connected first so later slots see it
+        self._current_profession = _TEXT_TO_PROF[self.profession_select.currentText()]
+        self.profession_select.currentTextChanged.connect(self._on_profession_text_changed)
         self.layout.addWidget(self.profession_select)
         
         # Price count selection
         price_layout = QHBoxLayout()
         price_layout.addWidget(QLabel("📊 Show lowest prices:"))
         self.price_count_select = QComboBox()
-        self.price_count_select.addItems(["5", "10", "25", "50"])
+        self.price_count_select.addItems([str(n) for n in PRICE_COUNTS])
         self.price_count_select.setCurrentText("25")  # Default
         self.price_count_select.currentTextChanged.connect(self.on_price_count_change)
         self.price_count_select.setToolTip("Select how many lowest prices to display")
@@ -430,6 +708,15 @@ class CraftingTab(BaseTab):
         self.recipe_container = QWidget()
         self.recipe_layout = QVBoxLayout(self.recipe_container)
         self.recipe_layout.setSpacing(5)
+        self.recipe_container.setStyleSheet(_RECIPE_BTN_QSS)
+        self._no_recipes_label = QLabel()
+        self._no_recipes_label.setStyleSheet("color: #cbd5e0; font-style: italic; padding: 20px;")
+        self._no_recipes_label.setAlignment(Qt.AlignCenter)
+        self._no_recipes_label.setVisible(False)
+        self.recipe_layout.addWidget(self._no_recipes_label)
+        self._ensure_recipe_buttons(self.recipes_per_page)
+        # Added once; pooled buttons are inserted above it to stay at the top
+        self.recipe_layout.addStretch()
         self.recipe_scroll.setWidget(self.recipe_container)
         
         recipe_container_layout.addWidget(QLabel("📋 Available Recipes (Click to Select):"))
@@ -451,22 +738,25 @@ class CraftingTab(BaseTab):
         self.price_count_select.currentTextChanged.connect(self.on_price_count_change)
         self.tool_type_group.buttonClicked.connect(self.on_tool_type_change)
 
+    def _on_profession_text_changed(self, text):
+        self._current_profession = _TEXT_TO_PROF[text]
+
     def on_skill_change(self, value):
-        profession = Profession[self.profession_select.currentText().replace(' ', '_')]
+        profession = self._current_profession
         self.player.skills[profession] = value
         self.skill_level_label.setText(str(value))
-        self.player.save()
-        self.update_recipe_display()
+        self._mark_player_dirty()
+        self._refresh_timer.start()
 
     def on_tool_change(self, value):
         # Save tool level per profession
-        profession = Profession[self.profession_select.currentText().replace(' ', '_')]
+        profession = self._current_profession
         if not hasattr(self.player, 'profession_tool_levels'):
             self.player.profession_tool_levels = {}
         self.player.profession_tool_levels[profession] = value
         self.tool_level_label.setText(str(value))
-        self.player.save()
-        self.update_recipe_display()
+        self._mark_player_dirty()
+        self._refresh_timer.start()
     
     def on_price_count_change(self, value):
         """Handle price count selection change"""
@@ -488,12 +778,10 @@ class CraftingTab(BaseTab):
     def next_page(self):
         """Go to next page"""
         # Calculate total pages based on filtered recipes
-        current_profession = Profession[self.profession_select.currentText().replace(' ', '_')]
+        current_profession = self._current_profession
         skill_level = self.player.skills.get(current_profession, 1)
-        filtered = [r for r in CRAFTING_RECIPES 
-                   if r.profession == current_profession 
-                   and r.skill_level <= skill_level]
-        total_pages = max(1, (len(filtered) + self.recipes_per_page - 1) // self.recipes_per_page)
+        total_recipes = _recipe_count_up_to(current_profession, skill_level)
+        total_pages = max(1, (total_recipes + self.recipes_per_page - 1) // self.recipes_per_page)
         
         if self.current_page < total_pages:
             self.current_page += 1
@@ -505,59 +793,101 @@ class CraftingTab(BaseTab):
         self.current_tool_type = tool_types[self.tool_type_group.id(button)]
         
         # Save tool type preference per profession
-        profession = Profession[self.profession_select.currentText().replace(' ', '_')]
+        profession = self._current_profession
         if not hasattr(self.player, 'tool_types'):
             self.player.tool_types = {}
         self.player.tool_types[profession] = self.current_tool_type
         
-        self.player.save()
-        self.update_recipe_display()
+        self._mark_player_dirty()
+        self._refresh_timer.start()
 
     def can_craft(self, recipe: Recipe) -> bool:
-        skill_req = self.player.skills[recipe.profession] >= recipe.tier.value
-        tool_req = self.player.tools[recipe.required_tool] >= recipe.tool_level
+        skill_req = self.player.skills.get(recipe.profession, 0) >= recipe.tier_value
+        tool_req = self.player.tools.get(recipe.required_tool, 0) >= recipe.tool_level
         return skill_req and tool_req
 
     def craft_item(self, recipe: Recipe):
         try:
             if not self.can_craft(recipe):
                 missing = []
-                if self.player.skills[recipe.profession] < recipe.tier.value:
-                    missing.append(f"skill level {recipe.tier.value}")
-                if self.player.tools[recipe.required_tool] < recipe.tool_level:
+                if self.player.skills.get(recipe.profession, 0) < recipe.tier_value:
+                    missing.append(f"skill level {recipe.tier_value}")
+                if self.player.tools.get(recipe.required_tool, 0) < recipe.tool_level:
                     missing.append(f"tool level {recipe.tool_level}")
                 raise ValueError(f"Cannot craft - missing requirements: {', '.join(missing)}")
             
             # Crafting logic here
             logger.info(f"Crafted: {recipe.name}")
-            self.player.save()
+            self._mark_player_dirty()
             
         except Exception as e:
             logger.error(f"Error: {str(e)}")
             return False
         return True
 
+    def _mark_player_dirty(self):
+        """Schedule a save; repeated changes within the timer window share one write"""
+        self._player_dirty = True
+        self._save_timer.start()
+
+    def _flush_player_save(self):
+        if self._player_dirty:
+            self._player_dirty = False
+            try:
+                self.player.save()
+            except OSError as e:
+                logger.error(f"❌ Error saving player data: {e}")
+
+    def flush_pending_save(self):
+        """Write any debounced player and preference changes immediately"""
+        self._save_timer.stop()
+        self._flush_player_save()
+        # Let a write already in flight finish so it cannot land after this one
+        _PREFS_POOL.waitForDone()
+        if self._prefs_timer.isActive():
+            self._prefs_timer.stop()
+            self._flush_prefs(wait=True)
+
+    def closeEvent(self, event):
+        self.flush_pending_save()
+        super().closeEvent(event)
+
+    def hideEvent(self, event):
+        # Switching away from the tab is a natural point to persist
+        self.flush_pending_save()
+        super().hideEvent(event)
+
     def update_recipes(self, profession_text):
         """Update recipes when profession changes"""
         self.current_page = 1  # Reset to first page when profession changes
-        self.update_recipe_display()
+        self._refresh_recipes()
+
+    def _refresh_recipes(self):
+        """Rebuild the recipe list now if the tab is visible, otherwise on its next show"""
+        if self.isVisible():
+            self.update_recipe_display()
+        else:
+            self._recipes_dirty = True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._recipes_dirty:
+            self.update_recipe_display()
 
     def update_recipe_display(self):
         """Update displayed recipes based on filters with pagination"""
+        self._recipes_dirty = False
         try:
-            current_profession = Profession[self.profession_select.currentText().replace(' ', '_')]
+            current_profession = self._current_profession
             skill_level = self.player.skills.get(current_profession, 1)
             price_count = int(self.price_count_select.currentText())
             
-            logger.debug(f"Profession={current_profession}, Skill={skill_level}, Price Count={price_count}")
+            logger.debug("Profession=%s, Skill=%s, Price Count=%s", current_profession, skill_level, price_count)
         
             # Filter recipes by profession and skill level
-            filtered = [r for r in CRAFTING_RECIPES 
-                       if r.profession == current_profession 
-                       and r.skill_level <= skill_level]
+            filtered = _recipes_up_to(current_profession, skill_level)
             
-            logger.debug(f"Found {len(filtered)} recipes for {current_profession}")
-            filtered.sort(key=lambda x: (x.skill_level, x.name))
+            logger.debug("Found %d recipes for %s", len(filtered), current_profession)
             
             # Calculate pagination
             total_recipes = len(filtered)
@@ -577,128 +907,110 @@ class CraftingTab(BaseTab):
             self.prev_page_btn.setEnabled(self.current_page > 1)
             self.next_page_btn.setEnabled(self.current_page < total_pages)
             
-            # Clear existing recipe buttons
-            for button in self.recipe_buttons:
-                button.deleteLater()
-            self.recipe_buttons.clear()
-            
-            # Create recipe buttons
+            # Reuse pooled buttons; only text, colour and checked state change
+            self._ensure_recipe_buttons(len(page_recipes))
+            self._no_recipes_label.setVisible(not page_recipes)
             if not page_recipes:
-                no_recipes_label = QLabel(f"No recipes available for {current_profession} at skill level {skill_level}")
-                no_recipes_label.setStyleSheet("color: #cbd5e0; font-style: italic; padding: 20px;")
-                no_recipes_label.setAlignment(Qt.AlignCenter)
-                self.recipe_layout.addWidget(no_recipes_label)
-                self.recipe_buttons.append(no_recipes_label)
+                self._no_recipes_label.setText(f"No recipes available for {current_profession} at skill level {skill_level}")
                 self.page_label.setText("Page 1 of 1 (0 recipes)")
                 self.prev_page_btn.setEnabled(False)
                 self.next_page_btn.setEnabled(False)
-            else:
-                for recipe in page_recipes:
-                    button = self.create_recipe_button(recipe, skill_level, price_count)
-                    self.recipe_layout.addWidget(button)
-                    self.recipe_buttons.append(button)
-                    
-                    # If this was the previously selected recipe, keep it selected
-                    if self.selected_recipe and recipe.name == self.selected_recipe.name:
-                        button.setChecked(True)
             
-            # Add stretch to push buttons to top
-            self.recipe_layout.addStretch()
+            selected_name = self.selected_recipe.name if self.selected_recipe else None
+            self._recipe_buttons = {}
+            # One storage pass for every material shown without price data
+            counts = self.player.get_item_counts(
+                {mat for r in page_recipes if not (r.material_prices and r.output_prices)
+                 for mat in r.materials}, "both")
+            for idx, button in enumerate(self.recipe_buttons):
+                if idx < len(page_recipes):
+                    recipe = page_recipes[idx]
+                    previous = self._button_recipes[idx]
+                    if previous is None or previous.profession is not recipe.profession:
+                        button.setIcon(_profession_qicon(recipe.profession))
+                    self._button_recipes[idx] = recipe
+                    button.setText(self._recipe_button_text(recipe, price_count, counts))
+                    bucket = _SKILL_BUCKET[min(recipe.skill_level, 100)]
+                    if button.property("skill") != bucket:
+                        button.setProperty("skill", bucket)
+                        # Re-evaluate the [skill=...] selectors for the new value
+                        button.style().unpolish(button)
+                        button.style().polish(button)
+                    # If this was the previously selected recipe, keep it selected
+                    button.setChecked(recipe.name == selected_name)
+                    button.setVisible(True)
+                    self._recipe_buttons[recipe.name] = button
+                else:
+                    self._button_recipes[idx] = None
+                    button.setVisible(False)
             
-            logger.debug(f"Displaying {len(page_recipes)} recipe buttons on page {self.current_page}")
+            self._checked_recipe_name = selected_name
+            logger.debug("Displaying %d recipe buttons on page %d", len(page_recipes), self.current_page)
             
         except Exception as e:
             logger.error(f"Error in update_recipe_display: {e}")
             # Show error in recipe area
             error_label = QLabel(f"Error loading recipes: {e}")
             error_label.setStyleSheet("color: #f87171; padding: 20px;")
-            self.recipe_layout.addWidget(error_label)
-
-    def create_recipe_button(self, recipe, skill_level, price_count):
-        """Create a clickable button for a recipe with all the formatting"""
-        button = QPushButton()
-        button.setCheckable(True)
-        button.clicked.connect(lambda checked, r=recipe: self.select_recipe(r))
-        
-        # Get profession icon
-        prof_icon = icon_manager.get_profession_icon(recipe.profession.name.lower())
-        
-        # Color-coded recipe name based on skill level
-        if recipe.skill_level <= 10:
-            skill_color = "#4ade80"  # Bright green for easy
-        elif recipe.skill_level <= 30:
-            skill_color = "#fbbf24"  # Bright yellow for medium
-        elif recipe.skill_level <= 60:
-            skill_color = "#fb923c"  # Bright orange for hard
-        else:
-            skill_color = "#f87171"  # Bright red for expert
-        
-        # Build button text with recipe info
-        button_text = f"{prof_icon} {recipe.name} (Tool Lv{getattr(recipe, 'tool_level', 1)}, Skill Lv{recipe.skill_level})"
-        
-        # Add price/material information
-        if hasattr(recipe, 'material_prices') and hasattr(recipe, 'output_prices'):
-            # Calculate profit
-            total_material_cost = sum(sum(recipe.material_prices[mat][:price_count])/len(recipe.material_prices[mat][:price_count]) * qty 
-                                    for mat, qty in recipe.materials.items() if mat in recipe.material_prices)
-            output_prices = recipe.output_prices[:price_count]
-            avg_output = sum(output_prices) / len(output_prices)
-            profit = avg_output - total_material_cost
-            
-            profit_text = f"Profit: {profit:.1f}g" if profit > 0 else f"Loss: {abs(profit):.1f}g"
-            button_text += f"\n💰 {profit_text}"
+            self.recipe_layout.insertWidget(self.recipe_layout.count() - 1, error_label)
+
+    def _ensure_recipe_buttons(self, count):
+        """Grow the recipe button pool to at least count buttons"""
+        while len(self.recipe_buttons) < count:
+            idx = len(self.recipe_buttons)
+            button = QPushButton()
+            button.setObjectName("recipeBtn")
+            button.setIconSize(_RECIPE_ICON_SIZE)
+            button.setCheckable(True)
+            button.setVisible(False)
+            button.clicked.connect(functools.partial(self._on_button_clicked, idx))
+            # After the empty-page label and the buttons already pooled
+            self.recipe_layout.insertWidget(idx + 1, button)
+            self.recipe_buttons.append(button)
+            self._button_recipes.append(None)
+
+    def _on_button_clicked(self, idx, checked=False):
+        recipe = self._button_recipes[idx]
+        if recipe is not None:
+            self.select_recipe(recipe)
+
+    def _recipe_button_text(self, recipe, price_count, counts):
+        """Button text for a recipe with tool/skill levels and price or material info
+
+        counts maps each unpriced recipe material to the player's total quantity.
+        """
+        # Header with recipe info, then one price/material line
+        # (the profession glyph is the button icon, not part of the text)
+        lines = [f"{recipe.name} (Tool Lv{recipe.tool_level}, Skill Lv{recipe.skill_level})"]
+        
+        if recipe.material_prices and recipe.output_prices:
+            lines.append(_profit_text(recipe, price_count))
         else:
             # Show material availability
-            available_materials = []
-            missing_materials = []
-            for material, quantity in recipe.materials.items():
-                available = self.player.get_item_count(material, "both")
-                if available >= quantity:
-                    available_materials.append(f"{material}: {available}/{quantity}")
-                else:
-                    missing_materials.append(f"{material}: {available}/{quantity}")
-            
+            missing_materials = [f"{material}: {counts[material]}/{quantity}"
+                                 for material, quantity in recipe.materials.items()
+                                 if counts[material] < quantity]
             if missing_materials:
-                button_text += f"\n❌ Missing: {', '.join(missing_materials[:2])}"
-                if len(missing_materials) > 2:
-                    button_text += f" (+{len(missing_materials)-2} more)"
+                more = len(missing_materials) - 2
+                lines.append(f"❌ Missing: {', '.join(missing_materials[:2])}"
+                             + (f" (+{more} more)" if more > 0 else ""))
             else:
-                button_text += f"\n✅ All materials available"
+                lines.append("✅ All materials available")
         
-        button.setText(button_text)
-        
-        # Style the button
-        button.setStyleSheet(f"""
-            QPushButton {{
-                text-align: left;
-                padding: 10px;
-                border: 2px solid #666;
-                border-radius: 6px;
-                background-color: #2a2a2a;
-                color: {skill_color};
-                font-size: 11px;
-                font-weight: bold;
-                min-height: 60px;
-            }}
-            QPushButton:hover {{
-                background-color: #3a3a3a;
-                border-color: #4a90e2;
-            }}
-            QPushButton:checked {{
-                background-color: #4a90e2;
-                border-color: #60a5fa;
-                color: white;
-            }}
-        """)
-        
-        return button
+        return "\n".join(lines)
     
     def select_recipe(self, recipe):
         """Handle recipe selection"""
-        # Uncheck all other recipe buttons
-        for btn in self.recipe_buttons:
-            if btn.isChecked() and btn.text() != f"{icon_manager.get_profession_icon(recipe.profession.name.lower())} {recipe.name}":
-                btn.setChecked(False)
+        # Only the button showing this recipe stays checked
+        previous = self._checked_recipe_name
+        if previous is not None and previous != recipe.name:
+            previous_btn = self._recipe_buttons.get(previous)
+            if previous_btn is not None:
+                previous_btn.setChecked(False)
+        button = self._recipe_buttons.get(recipe.name)
+        if button is not None:
+            button.setChecked(True)
+        self._checked_recipe_name = recipe.name
         
         self.selected_recipe = recipe
         self.update_material_status()
@@ -707,25 +1019,23 @@ class CraftingTab(BaseTab):
     def update_material_status(self):
         """Update the material status display for selected recipe"""
         if not self.selected_recipe:
+            self._mat_status_sig = None
             self.material_status_label.setText("💡 Select a recipe to see material availability")
             return
         
         recipe = self.selected_recipe
-        status_parts = []
-        
-        for material, quantity in recipe.materials.items():
-            available = self.player.get_item_count(material, "both")
-            if available >= quantity:
-                status = "✅"
-            else:
-                status = "❌"
-            
-            status_parts.append(
-                f"  {status} {material}: {available} / {quantity}"
-            )
+        counts = self.player.get_item_counts(recipe.materials, "both")
+        # Skip the rebuild and relayout when nothing shown would change
+        signature = (recipe.name, tuple((material, counts[material], quantity)
+                                        for material, quantity in recipe.materials.items()))
+        if signature == self._mat_status_sig:
+            return
+        self._mat_status_sig = signature
         
-        status_text = f"📋 {recipe.name} Materials:\n" + "\n".join(status_parts)
-        self.material_status_label.setText(status_text)
+        self.material_status_label.setText("\n".join(chain(
+            (f"📋 {recipe.name} Materials:",),
+            (f"  {_STATUS_OK if available >= quantity else _STATUS_BAD} {material}: {available} / {quantity}"
+             for material, available, quantity in signature[1]))))
     
     def get_selected_recipe(self):
         """Get currently selected recipe from display"""
@@ -734,92 +1044,97 @@ class CraftingTab(BaseTab):
     def load_preferences(self):
         """Load user preferences for price display"""
         try:
-            prefs_file = Path(__file__).parent.parent / 'saves' / 'ui_preferences.json'
-            if prefs_file.exists():
-                with open(prefs_file, 'r') as f:
-                    prefs = json.load(f)
-                    self.price_count_preference = prefs.get('price_count', 5)
-            else:
-                self.price_count_preference = 5
-        except Exception as e:
+            self.price_count_preference = _read_prefs(_PREFS_PATH).get('price_count', 5)
+        except (OSError, ValueError) as e:  # Unreadable or malformed file
             logger.error(f"Error loading preferences: {e}")
             self.price_count_preference = 5
     
     def load_profession_levels(self):
         """Load saved skill and tool levels for current profession"""
-        try:
-            profession = Profession[self.profession_select.currentText().replace(' ', '_')]
-            
-            # Load skill level
-            skill_level = self.player.skills.get(profession, 1)
-            self.skill_level.setValue(skill_level)
-            self.skill_level_label.setText(str(skill_level))
-            
-            # Load tool level per profession (not just ToolType.FORGE)
-            if not hasattr(self.player, 'profession_tool_levels'):
-                self.player.profession_tool_levels = {}
-            tool_level = self.player.profession_tool_levels.get(profession, 1)
-            self.tool_level.setValue(tool_level)
-            self.tool_level_label.setText(str(tool_level))
-            
-            # Load tool type preference (default to Basic)
-            tool_type_pref = getattr(self.player, 'tool_types', {}).get(profession, "Basic")
-            if tool_type_pref == "Advanced":
-                self.tool_advanced.setChecked(True)
-                self.current_tool_type = "Advanced"
-            elif tool_type_pref == "Improved":
-                self.tool_improved.setChecked(True)
-                self.current_tool_type = "Improved"
-            else:
-                self.tool_basic.setChecked(True)
-                self.current_tool_type = "Basic"
-            
-            # Update recipe display
-            self.update_recipe_display()
-        except Exception as e:
-            logger.error(f"Error loading profession levels: {e}")
+        profession = self._current_profession
+        
+        # Load skill level
+        skill_level = self.player.skills.get(profession, 1)
+        # Populating from saved state must not re-save or trigger a rebuild per widget
+        blockers = [QSignalBlocker(w) for w in (self.skill_level, self.tool_level)]
+        self.skill_level.setValue(skill_level)
+        self.skill_level_label.setText(str(skill_level))
+        
+        # Load tool level per profession (not just ToolType.FORGE)
+        if not hasattr(self.player, 'profession_tool_levels'):
+            self.player.profession_tool_levels = {}
+        tool_level = self.player.profession_tool_levels.get(profession, 1)
+        self.tool_level.setValue(tool_level)
+        self.tool_level_label.setText(str(tool_level))
+        
+        # Load tool type preference (default to Basic)
+        tool_type_pref = getattr(self.player, 'tool_types', {}).get(profession, "Basic")
+        if tool_type_pref == "Advanced":
+            self.tool_advanced.setChecked(True)
+            self.current_tool_type = "Advanced"
+        elif tool_type_pref == "Improved":
+            self.tool_improved.setChecked(True)
+            self.current_tool_type = "Improved"
+        else:
+            self.tool_basic.setChecked(True)
+            self.current_tool_type = "Basic"
+        
+        del blockers
+        
+        # Update recipe display
+        self._refresh_recipes()
     
     def save_preferences(self):
-        """Save user preferences for price display"""
-        try:
-            prefs_file = Path(__file__).parent.parent / 'saves' / 'ui_preferences.json'
-            prefs_file.parent.mkdir(exist_ok=True)
-            
-            prefs = {'price_count': int(self.price_count_select.currentText())}
-            
-            with open(prefs_file, 'w') as f:
-                json.dump(prefs, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving preferences: {e}")
+        """Save user preferences for price display; the write is debounced"""
+        prefs = {'price_count': int(self.price_count_select.currentText())}
+        # Re-selecting the value already saved (or queued) needs no write
+        latest = _PENDING_PREFS.get(_PREFS_PATH)
+        if latest is None:
+            cached = _PREFS_CACHE.get(_PREFS_PATH)
+            latest = cached[1] if cached else None
+        if prefs == latest:
+            return
+        _PENDING_PREFS[_PREFS_PATH] = prefs
+        self._prefs_timer.start()
+
+    def _flush_prefs(self, wait=False):
+        """Hand the pending preferences to a pooled writer, or write them now if wait is set"""
+        prefs = _PENDING_PREFS.get(_PREFS_PATH)
+        if prefs is None:
+            return
+        if wait:
+            _write_prefs(_PREFS_PATH, prefs)
+        else:
+            _PREFS_POOL.start(PrefsWriteTask(_PREFS_PATH, prefs))
 
     def check_for_updates(self, recipe):
         """Check if recipe has been updated"""
+        # Not wired to selection; the recipe JSON carries no version field yet
+        version = getattr(recipe, "version", None)
+        if version is None:
+            return
         current_version = self.current_versions.get(recipe.name)
-        if current_version and recipe.version != current_version:
+        if current_version and version != current_version:
             changes = compare_recipes(recipe, self.get_latest_recipe(recipe.name))
             if changes:
                 self.notifier.show_update_alert(changes)
-        self.current_versions[recipe.name] = recipe.version
+        self.current_versions[recipe.name] = version
     
     def reset_inventory(self, value=0):
         """Reset inventory to specified value"""
-        try:
-            self.player.reset_inventory(value)
-            self.player.save()
-            self.update_material_status()
-            logger.info(f"✅ Inventory reset to {value} for all materials")
-        except Exception as e:
-            logger.error(f"❌ Error resetting inventory: {e}")
+        self.player.reset_inventory(value)
+        # Show the new counts now; the save shares the debounced write
+        self.update_material_status()
+        self._mark_player_dirty()
+        logger.info(f"✅ Inventory reset to {value} for all materials")
     
     def reset_storage(self, value=1000):
         """Reset storage to specified value"""
-        try:
-            self.player.reset_storage(value)
-            self.player.save()
-            self.update_material_status()
-            logger.info(f"✅ Storage reset to {value} for all materials")
-        except Exception as e:
-            logger.error(f"❌ Error resetting storage: {e}")
+        self.player.reset_storage(value)
+        # Show the new counts now; the save shares the debounced write
+        self.update_material_status()
+        self._mark_player_dirty()
+        logger.info(f"✅ Storage reset to {value} for all materials")
     
     def reset_storage_1k(self):
         """Reset storage to 1000 for all materials"""
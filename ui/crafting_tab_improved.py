@@ -9,127 +9,113 @@ Fixes:
 """
 
 from ui.base_tab import BaseTab
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
+from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                      QComboBox, QSlider, QPushButton, QTextEdit, 
                                      QSpinBox, QGroupBox, QScrollArea, QFrame,
                                      QToolTip, QSizePolicy, QButtonGroup, QRadioButton,
                                      QGridLayout, QSplitter)
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import Qt, Signal, QTimer, QRunnable, QThreadPool
 from PySide6.QtGui import QFont, QPixmap, QIcon
-from data.enums import Profession, ToolType, Recipe, ProfessionTier
+from data.enums import Profession
 from data.player import Player
 from utils.recipe_loader import RecipeLoader
+from utils import json_io
+import functools
+from collections import deque
+from bisect import bisect_left, bisect_right
 import json
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Load recipes from all profession JSON files
-def load_recipes():
-    """Load all recipes from JSON files"""
-    all_recipes = []
-    
-    recipe_files = {
-        'cooking': 'data/recipes_cooking.json',
-        'woodworking': 'data/recipes_woodworking.json',
-        'tailoring': 'data/recipes_tailoring.json',
-        'alchemy': 'data/recipes_alchemy.json',
-        'weaponsmith': 'data/recipes_weaponsmith.json',
-        'armorsmith': 'data/recipes_armorsmith.json',
-        'shipbuilding': 'data/recipes_shipbuilding.json'
-    }
-    
-    for profession_name, file_path in recipe_files.items():
-        try:
-            full_path = Path(__file__).parent.parent / file_path
-            if full_path.exists():
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    recipes = data.get('recipes', [])
-                    logger.debug(f"Loading {len(recipes)} {profession_name} recipes from JSON")
-                    
-                    for i, recipe_data in enumerate(recipes, 1):
-                        try:
-                            # Map profession string to enum
-                            prof_map = {
-                                'blacksmithing': Profession.WEAPONSMITH,  # Map blacksmithing to weaponsmith
-                                'weaponsmith': Profession.WEAPONSMITH,
-                                'armorsmith': Profession.ARMORSMITH,
-                                'alchemy': Profession.ALCHEMY,
-                                'cooking': Profession.COOKING,
-                                'woodworking': Profession.WOODWORKING,
-                                'shipbuilding': Profession.SHIPBUILDING
-                            }
-                            
-                            # Map profession to appropriate tool
-                            tool_map = {
-                                'blacksmithing': ToolType.FORGE,  # Blacksmithing recipes use forge
-                                'weaponsmith': ToolType.FORGE,
-                                'armorsmith': ToolType.ANVIL,
-                                'alchemy': ToolType.ALCHEMY_TABLE,
-                                'cooking': ToolType.COOKING_STATION,
-                                'woodworking': ToolType.WORKBENCH,
-                                'shipbuilding': ToolType.DOCK
-                            }
-                            
-                            # Determine tier based on skill level
-                            skill = recipe_data.get('skill_level', 1)
-                            if skill <= 25:
-                                tier = ProfessionTier.APPRENTICE
-                            elif skill <= 50:
-                                tier = ProfessionTier.JOURNEYMAN
-                            elif skill <= 75:
-                                tier = ProfessionTier.EXPERT
-                            else:
-                                tier = ProfessionTier.MASTER
-                            
-                            recipe = Recipe(
-                                name=recipe_data['recipe_name'],  # Use 'recipe_name' from JSON
-                                profession=prof_map.get(profession_name, Profession.WEAPONSMITH),
-                                tier=tier,
-                                materials=recipe_data.get('materials', {}),
-                                tool=tool_map.get(profession_name, ToolType.FORGE),  # Map profession to tool
-                                tool_level=recipe_data.get('tool_level', 1),
-                                skill_level=skill
-                            )
-                            all_recipes.append(recipe)
-                            logger.debug(f"Loaded {profession_name} recipe {i}: {recipe.name} (Skill: {recipe.skill_level})")
-                        except Exception as e:
-                            logger.error(f"Error loading recipe {i} from {profession_name}: {e}")
-                    
-                    logger.debug(f"Successfully loaded {len(recipes)} {profession_name} recipes")
-            else:
-                logger.warning(f"Warning: Recipe file not found: {file_path}")
-        except Exception as e:
-            logger.error(f"Error loading {profession_name} recipes: {e}")
+HISTORY_LIMIT = 200  # Crafting history entries kept on screen
+
+# Common crafted items to display
+COMMON_CRAFTED = (
+    "Bread", "Meat Stew", "Health Potion",
+    "Iron Sword", "Iron Dagger", "Steel Longsword",
+    "Wooden Bow", "Wooden Shield", "Elven Staff",
+    "Linen Shirt", "Wool Cloak", "Silk Robe",
+    "Minor Health Potion", "Mana Potion", "Greater Healing Elixir",
+    "Small Fishing Boat", "Merchant Vessel", "War Galley"
+)
+
+# Common raw materials
+RAW_MATERIALS = (
+    "wheat", "water", "iron", "wood", "leather", "cloth",
+    "stone", "herbs", "meat", "fish", "coal", "oil"
+)
+
+class RecipePreloadTask(QRunnable):
+    """Pooled task that parses the remaining recipe files off the UI thread"""
     
-    logger.debug(f"Total recipes loaded: {len(all_recipes)}")
-    return all_recipes
+    def __init__(self, recipe_loader):
+        super().__init__()
+        self.recipe_loader = recipe_loader
+    
+    def run(self):
+        self.recipe_loader.preload()
 
-CRAFTING_RECIPES = load_recipes()
+# Determine difficulty color
+_DIFFICULTY_COLORS = {
+    "Easy": "#38a169",      # Green
+    "Medium": "#d69e2e",    # Yellow
+    "Hard": "#dd6b20",      # Orange
+    "Expert": "#e53e3e"     # Red
+}
+_DIFFICULTIES = tuple(_DIFFICULTY_COLORS)  # Easy, Medium, Hard, Expert
 
 class ImprovedCraftingTab(BaseTab):
     """Improved Crafting Tab with better UI/UX"""
     
+    # Recipe button stylesheet per difficulty, formatted once instead of per refresh
+    _STYLESHEETS = {difficulty: f"""
+            QPushButton {{
+                text-align: left;
+                padding: 10px;
+                border: 2px solid {color};
+                border-radius: 5px;
+                background-color: #2d3748;
+                color: #e2e8f0;
+                font-size: 11px;
+                min-height: 60px;
+            }}
+            QPushButton:hover {{
+                background-color: #4a5568;
+            }}
+            QPushButton:checked {{
+                background-color: #3182ce;
+                border-color: #63b3ed;
+            }}
+        """ for difficulty, color in _DIFFICULTY_COLORS.items()}
+    
     def __init__(self, player=None):
         super().__init__("Crafting")
         self.current_tool_type = "Basic"
         self.current_page = 1
         self.recipes_per_page = 10  # Default
         self.selected_recipe = None
-        self.recipe_buttons = []
+        self.recipe_buttons = []  # Pooled recipe buttons, reused across refreshes
+        self._button_recipes = []  # Recipe shown by each pooled button (None if hidden)
         self.player = player if player else Player()
         if not player:
             self.player.load()
         self.recipe_loader = RecipeLoader()
         self.recipes = []
+        self._history = deque(maxlen=HISTORY_LIMIT)  # Crafting history messages, newest first
+        self._current_profession = Profession.ALCHEMY  # Follows the profession combo
+        # Filtered recipe lists keyed by (profession, skill_level, max_tool_level)
+        self._filter_cache = {}
+        self._skill_levels = []  # skill_level of each entry in self.recipes (sorted ascending)
         
         # Store skill levels per profession to avoid resetting
         self.profession_skills = {}
         
         self.load_preferences()
         self.setup_improved_ui()
+        # The shown profession is loaded; warm the rest before the user switches
+        QThreadPool.globalInstance().start(RecipePreloadTask(self.recipe_loader))
         
         # Load initial profession skill
         self.load_profession_skill()
@@ -137,38 +123,31 @@ class ImprovedCraftingTab(BaseTab):
     def load_profession_skill(self):
         """Load saved skill level for current profession"""
         try:
-            current_index = self.profession_combo.currentIndex()
-            if current_index >= 0:
-                profession = self.profession_combo.itemData(current_index)
-                if profession in self.profession_skills:
-                    # Block signals to prevent infinite loop
-                    self.skill_level.blockSignals(True)
-                    self.skill_level.setValue(self.profession_skills[profession])
-                    self.skill_level.blockSignals(False)
-                    self.skill_level_label.setText(str(self.profession_skills[profession]))
-                    logger.debug(f"Loaded skill {self.profession_skills[profession]} for {profession}")
+            profession = self._current_profession
+            if profession in self.profession_skills:
+                # Block signals to prevent infinite loop
+                self.skill_level.blockSignals(True)
+                self.skill_level.setValue(self.profession_skills[profession])
+                self.skill_level.blockSignals(False)
+                self.skill_level_label.setText(str(self.profession_skills[profession]))
+                logger.debug("Loaded skill %s for %s", self.profession_skills[profession], profession)
         except Exception as e:
             logger.error(f"Error loading profession skill: {e}")
     
     def save_profession_skill(self):
         """Save current skill level for current profession"""
         try:
-            current_index = self.profession_combo.currentIndex()
-            if current_index >= 0:
-                profession = self.profession_combo.itemData(current_index)
-                skill_value = self.skill_level.value()
-                self.profession_skills[profession] = skill_value
-                logger.debug(f"Saved skill {skill_value} for {profession}")
-                self.save_preferences()
+            profession = self._current_profession
+            skill_value = self.skill_level.value()
+            self.profession_skills[profession] = skill_value
+            logger.debug("Saved skill %s for %s", skill_value, profession)
+            self.save_preferences()
         except Exception as e:
             logger.error(f"Error saving profession skill: {e}")
     
     def get_current_profession(self):
         """Get currently selected profession"""
-        current_index = self.profession_combo.currentIndex()
-        if current_index >= 0:
-            return self.profession_combo.itemData(current_index)
-        return Profession.ALCHEMY
+        return self._current_profession
     
     def on_recipes_per_page_change(self, value):
         """Handle recipes per page selection change"""
@@ -177,17 +156,31 @@ class ImprovedCraftingTab(BaseTab):
         self.update_recipe_display()
         self.save_preferences()
     
+    def _on_profession_index(self, index):
+        """Track the selected profession, then refresh for it"""
+        if index < 0:
+            return
+        if self._skill_timer.isActive():
+            # A pending skill change belongs to the profession being left
+            self._skill_timer.stop()
+            self.save_profession_skill()
+        self._current_profession = self.profession_combo.itemData(index)
+        self.on_profession_change()
+    
     def on_profession_change(self):
         """Handle profession selection change"""
         self.current_page = 1
-        self.update_recipes()
-        self.update_recipe_display()
-        self.update_inventory_display()
+        # Restore the saved skill first so the one rebuild below filters with it;
+        # update_recipes redraws the recipe list, material status and inventory
         self.load_profession_skill()
+        self.update_recipes()
     
     def on_skill_change(self, value):
-        """Handle skill level change"""
+        """Handle skill level change; the rebuild waits until the slider settles"""
         self.skill_level_label.setText(str(value))
+        self._skill_timer.start()
+    
+    def _apply_skill_change(self):
         self.update_recipe_display()
         self.save_profession_skill()
     
@@ -197,7 +190,7 @@ class ImprovedCraftingTab(BaseTab):
         tier_map = {"Basic": 1, "Improved": 2, "Advanced": 3}
         tool_tier_value = tier_map.get(value, 1)
         
-        logger.debug(f"Tool tier changed to: {value} (value: {tool_tier_value})")
+        logger.debug("Tool tier changed to: %s (value: %s)", value, tool_tier_value)
         self.current_tool_type = value
         self.update_recipe_display()
         self.save_preferences()
@@ -215,58 +208,36 @@ class ImprovedCraftingTab(BaseTab):
     
     def update_recipes(self):
         """Update recipes based on current profession selection"""
-        try:
-            # Get the profession object directly from combo box data
-            current_index = self.profession_combo.currentIndex()
-            if current_index >= 0:
-                profession = self.profession_combo.itemData(current_index)
-            else:
-                profession = Profession.WEAPONSMITH
-        except (KeyError, AttributeError):
-            profession = Profession.WEAPONSMITH
-        
         # Load recipes for the selected profession
-        self.recipes = self.recipe_loader.get_recipes_for_profession(profession)
+        self.recipes = self.recipe_loader.get_recipes_for_profession(self._current_profession)
+        self._skill_levels = [recipe.skill_level for recipe in self.recipes]
+        self._filter_cache.clear()
         self.current_page = 1
         self.update_recipe_display()
     
     def update_recipe_display(self):
         """Update displayed recipes based on filters with pagination"""
-        # Clear existing buttons
-        for button in self.recipe_buttons:
-            button.deleteLater()
-        self.recipe_buttons.clear()
-        
-        # Get current profession
-        try:
-            # Get the profession object directly from combo box data
-            current_index = self.profession_combo.currentIndex()
-            if current_index >= 0:
-                profession = self.profession_combo.itemData(current_index)
-            else:
-                profession = Profession.WEAPONSMITH
-        except (KeyError, AttributeError):
-            profession = Profession.WEAPONSMITH
-        
+        profession = self._current_profession
         skill_level = self.skill_level.value()
         
-        logger.debug(f"Profession={profession}, Skill={skill_level}, Recipes per page={self.recipes_per_page}")
-        
-        # Filter recipes
-        filtered_recipes = []
+        logger.debug("Profession=%s, Skill=%s, Recipes per page=%s", profession, skill_level, self.recipes_per_page)
         
         # Get current tool tier
         current_tool_tier = self.tool_level_combo.currentText()
         tier_map = {"Basic": 1, "Improved": 2, "Advanced": 3}
         max_tool_level = tier_map.get(current_tool_tier, 3)  # Default to Advanced
         
-        for recipe in self.recipes:  # Use self.recipes instead of CRAFTING_RECIPES
-            if (recipe.profession == profession and 
-                recipe.skill_level <= skill_level and
-                recipe.tool_level <= max_tool_level):
-                filtered_recipes.append(recipe)
+        # Filter recipes; page flips and repeat values reuse the last pass
+        key = (profession, skill_level, max_tool_level)
+        filtered_recipes = self._filter_cache.get(key)
+        if filtered_recipes is None:
+            # self.recipes holds only this profession, sorted by skill level
+            unlocked = self.recipes[:bisect_right(self._skill_levels, skill_level)]
+            filtered_recipes = [recipe for recipe in unlocked
+                                if recipe.tool_level <= max_tool_level]
+            self._filter_cache[key] = filtered_recipes
         
-        logger.debug(f"Found {len(filtered_recipes)} recipes for {profession}")
+        logger.debug("Found %d recipes for %s", len(filtered_recipes), profession)
         
         # Pagination
         total_pages = max(1, (len(filtered_recipes) + self.recipes_per_page - 1) // self.recipes_per_page)
@@ -276,51 +247,82 @@ class ImprovedCraftingTab(BaseTab):
         end_idx = start_idx + self.recipes_per_page
         page_recipes = filtered_recipes[start_idx:end_idx]
         
-        logger.debug(f"Displaying {len(page_recipes)} recipe buttons on page {self.current_page}")
+        logger.debug("Displaying %d recipe buttons on page %d", len(page_recipes), self.current_page)
         
         # Update page controls
         self.page_label.setText(f"Page {self.current_page} of {total_pages}")
         self.prev_page_btn.setEnabled(self.current_page > 1)
         self.next_page_btn.setEnabled(self.current_page < total_pages)
         
-        # Create recipe buttons
-        for recipe in page_recipes:
-            button = self.create_recipe_button(recipe, skill_level)
-            self.recipe_layout.insertWidget(self.recipe_layout.count() - 1, button)
-            self.recipe_buttons.append(button)
+        # Repaint and relayout once for the whole page, not once per button
+        self.recipe_container.setUpdatesEnabled(False)
+        try:
+            # Reuse pooled buttons; only text, style and checked state change
+            self._ensure_recipe_buttons(len(page_recipes))
+            # One storage pass for every material shown on this page
+            counts = self.player.get_item_counts(
+                {material for recipe in page_recipes for material in recipe.materials}, "both")
+            # Integer difficulty thresholds, computed once per refresh
+            difficulty_caps = (skill_level // 2, skill_level * 3 // 4, skill_level)
+            for idx, button in enumerate(self.recipe_buttons):
+                if idx < len(page_recipes):
+                    recipe = page_recipes[idx]
+                    self._button_recipes[idx] = recipe
+                    self._configure_button(button, recipe, difficulty_caps, counts)
+                    button.show()
+                else:
+                    self._button_recipes[idx] = None
+                    button.hide()
+            
+            # The exclusive group unchecks the previous button; only "none on this page" needs help
+            selected_idx = next((idx for idx, recipe in enumerate(page_recipes)
+                                 if recipe is self.selected_recipe), None)
+            if selected_idx is not None:
+                self.recipe_buttons[selected_idx].setChecked(True)
+            else:
+                checked = self._recipe_group.checkedButton()
+                if checked is not None:
+                    self._recipe_group.setExclusive(False)
+                    checked.setChecked(False)
+                    self._recipe_group.setExclusive(True)
+        finally:
+            self.recipe_container.setUpdatesEnabled(True)
         
         # Update material status
         self.update_material_status()
     
-    def create_recipe_button(self, recipe, skill_level):
-        """Create a clickable button for a recipe with all the formatting"""
-        button = QPushButton()
-        button.setCheckable(True)
-        button.clicked.connect(lambda: self.select_recipe(recipe))
-        
-        # Determine difficulty color
-        difficulty_colors = {
-            "Easy": "#38a169",      # Green
-            "Medium": "#d69e2e",    # Yellow
-            "Hard": "#dd6b20",      # Orange
-            "Expert": "#e53e3e"     # Red
-        }
-        
-        if recipe.skill_level <= skill_level * 0.5:
-            difficulty = "Easy"
-        elif recipe.skill_level <= skill_level * 0.75:
-            difficulty = "Medium"
-        elif recipe.skill_level <= skill_level:
-            difficulty = "Hard"
-        else:
-            difficulty = "Expert"
-        
-        color = difficulty_colors[difficulty]
+    def _ensure_recipe_buttons(self, count):
+        """Grow the recipe button pool to at least count buttons"""
+        while len(self.recipe_buttons) < count:
+            idx = len(self.recipe_buttons)
+            button = QPushButton()
+            button.setCheckable(True)
+            button.hide()
+            button.clicked.connect(functools.partial(self._on_button_clicked, idx))
+            self._recipe_group.addButton(button)
+            # Ahead of the trailing stretch
+            self.recipe_layout.insertWidget(idx, button)
+            self.recipe_buttons.append(button)
+            self._button_recipes.append(None)
+    
+    def _on_button_clicked(self, idx, checked=False):
+        recipe = self._button_recipes[idx]
+        if recipe is not None:
+            self.select_recipe(recipe)
+    
+    def _configure_button(self, button, recipe, difficulty_caps, counts):
+        """Show recipe on a pooled button with all the formatting
+
+        difficulty_caps holds the highest Easy/Medium/Hard recipe skill for the current
+        skill level; counts maps each recipe material to the player's total quantity.
+        """
+        # Thresholds are inclusive: at most half the skill is Easy, at most 3/4 Medium, ...
+        difficulty = _DIFFICULTIES[bisect_left(difficulty_caps, recipe.skill_level)]
         
         # Format materials
         materials_text = []
         for material, quantity in recipe.materials.items():
-            available = self.player.get_item_count(material, "both")
+            available = counts[material]
             status = "✅" if available >= quantity else "❌"
             materials_text.append(f"{status} {material}: {available}/{quantity}")
         
@@ -332,35 +334,13 @@ class ImprovedCraftingTab(BaseTab):
         """.strip()
         
         button.setText(button_text)
-        button.setStyleSheet(f"""
-            QPushButton {{
-                text-align: left;
-                padding: 10px;
-                border: 2px solid {color};
-                border-radius: 5px;
-                background-color: #2d3748;
-                color: #e2e8f0;
-                font-size: 11px;
-                min-height: 60px;
-            }}
-            QPushButton:hover {{
-                background-color: #4a5568;
-            }}
-            QPushButton:checked {{
-                background-color: #3182ce;
-                border-color: #63b3ed;
-            }}
-        """)
-        
-        return button
+        # Pooled buttons keep their style; only a new difficulty needs a QSS reparse
+        stylesheet = self._STYLESHEETS[difficulty]
+        if button.styleSheet() != stylesheet:
+            button.setStyleSheet(stylesheet)
     
     def select_recipe(self, recipe):
         """Handle recipe selection"""
-        # Uncheck other buttons
-        for button in self.recipe_buttons:
-            if button != self.sender():
-                button.setChecked(False)
-        
         self.selected_recipe = recipe
         self.craft_button.setEnabled(True)
         self.update_material_status()
@@ -418,10 +398,8 @@ class ImprovedCraftingTab(BaseTab):
             detailed_message = "\n".join(feedback_lines)
             logger.info(detailed_message)
             
-            # Update displays
-            self.update_material_status()
+            # Update displays (the recipe refresh also redraws material status and inventory)
             self.update_recipe_display()
-            self.update_inventory_display()
             self.update_crafting_history(detailed_message)
         else:
             logger.error(f"❌ {message}")
@@ -430,9 +408,8 @@ class ImprovedCraftingTab(BaseTab):
         """Reset inventory to specified value"""
         try:
             self.player.reset_inventory(value)
-            self.player.save()
+            self._mark_player_dirty()
             self.update_material_status()
-            self.update_inventory_display()
             logger.info(f"✅ Inventory reset to {value} for all materials")
         except Exception as e:
             logger.error(f"❌ Error resetting inventory: {e}")
@@ -441,9 +418,8 @@ class ImprovedCraftingTab(BaseTab):
         """Reset storage to 1000 for all materials"""
         try:
             self.player.reset_storage(1000)
-            self.player.save()
+            self._mark_player_dirty()
             self.update_material_status()
-            self.update_inventory_display()
             logger.info(f"✅ Storage reset to 1000 for all materials")
         except Exception as e:
             logger.error(f"❌ Error resetting storage: {e}")
@@ -452,9 +428,8 @@ class ImprovedCraftingTab(BaseTab):
         """Reset storage to 10000 for all materials"""
         try:
             self.player.reset_storage(10000)
-            self.player.save()
+            self._mark_player_dirty()
             self.update_material_status()
-            self.update_inventory_display()
             logger.info(f"✅ Storage reset to 10000 for all materials")
         except Exception as e:
             logger.error(f"❌ Error resetting storage: {e}")
@@ -493,11 +468,41 @@ class ImprovedCraftingTab(BaseTab):
             self.recipes_per_page = 10
     
     def save_preferences(self):
-        """Save user preferences to disk"""
+        """Mark preferences changed; the disk write is debounced"""
+        self._prefs_dirty = True
+        self._prefs_timer.start()
+    
+    def _mark_player_dirty(self):
+        """Schedule a player save; repeated changes within the timer window share one write"""
+        self._player_dirty = True
+        self._save_timer.start()
+    
+    def _flush_player_save(self):
+        if self._player_dirty:
+            self._player_dirty = False
+            try:
+                self.player.save()
+            except OSError as e:
+                logger.error(f"❌ Error saving player data: {e}")
+    
+    def flush_pending_save(self):
+        """Write debounced player and preference changes immediately"""
+        self._save_timer.stop()
+        self._flush_player_save()
+        self._prefs_timer.stop()
+        self._flush_prefs()
+    
+    def closeEvent(self, event):
+        self.flush_pending_save()
+        super().closeEvent(event)
+    
+    def _flush_prefs(self):
+        """Save user preferences to disk if anything changed since the last write"""
+        if not self._prefs_dirty:
+            return
+        self._prefs_dirty = False
         try:
-            # Create saves directory if it doesn't exist
             prefs_file = Path(__file__).parent.parent / 'saves' / 'ui_preferences.json'
-            prefs_file.parent.mkdir(exist_ok=True)
             
             # Convert profession skills to JSON-serializable format
             profession_skills_serializable = {}
@@ -511,9 +516,9 @@ class ImprovedCraftingTab(BaseTab):
                 'current_tool_type': self.current_tool_type
             }
             
-            with open(prefs_file, 'w') as f:
-                json.dump(prefs, f, indent=2)
-                
+            # Compact encoding via temp file + rename, so a crash never leaves half a file
+            json_io.dump_path(prefs_file, prefs)
+            
             logger.debug("UI preferences saved successfully")
         except Exception as e:
             logger.error(f"Error saving preferences: {e}")
@@ -523,41 +528,21 @@ class ImprovedCraftingTab(BaseTab):
         try:
             inventory_text = "🎒 Crafted Items:\n"
             
-            # Get all items that are likely crafted items (not raw materials)
-            crafted_items = {}
-            storage_system = self.player.storage_system
-            
-            # Common crafted items to display
-            common_crafted = [
-                "Bread", "Meat Stew", "Health Potion",
-                "Iron Sword", "Iron Dagger", "Steel Longsword",
-                "Wooden Bow", "Wooden Shield", "Elven Staff",
-                "Linen Shirt", "Wool Cloak", "Silk Robe",
-                "Minor Health Potion", "Mana Potion", "Greater Healing Elixir",
-                "Small Fishing Boat", "Merchant Vessel", "War Galley"
-            ]
-            
-            for item in common_crafted:
-                count = storage_system.get_item_count(item)
-                if count > 0:
-                    crafted_items[item] = count
+            # One pass over storage instead of a per-item lookup across every location
+            totals = self.player.storage_system.snapshot()
+            crafted_items = [(item, totals[item]) for item in COMMON_CRAFTED
+                             if totals.get(item, 0) > 0]
             
             if crafted_items:
-                for item, count in crafted_items.items():
+                for item, count in crafted_items:
                     inventory_text += f"  • {item}: {count}\n"
             else:
                 inventory_text += "  No crafted items yet\n"
             
             inventory_text += "\n📦 Raw Materials:\n"
             
-            # Common raw materials
-            raw_materials = [
-                "wheat", "water", "iron", "wood", "leather", "cloth",
-                "stone", "herbs", "meat", "fish", "coal", "oil"
-            ]
-            
-            for material in raw_materials:
-                count = storage_system.get_item_count(material)
+            for material in RAW_MATERIALS:
+                count = totals.get(material, 0)
                 if count > 0:
                     inventory_text += f"  • {material}: {count}\n"
             
@@ -568,15 +553,38 @@ class ImprovedCraftingTab(BaseTab):
     
     def update_crafting_history(self, message):
         """Update the crafting history display"""
-        current_text = self.crafting_history.toPlainText()
-        self.crafting_history.setText(f"{message}\n\n{current_text}")
+        # Newest first, capped so each update stays the same size
+        self._history.appendleft(message)
+        self.crafting_history.setPlainText("\n\n".join(self._history))
     
     def clear_crafting_history(self):
         """Clear the crafting history display"""
+        self._history.clear()
         self.crafting_history.clear()
 
     def setup_improved_ui(self):
         """Setup improved UI with better layout and functionality"""
+        # Coalesce skill slider steps into one rebuild once dragging pauses
+        self._skill_timer = QTimer(self)
+        self._skill_timer.setSingleShot(True)
+        self._skill_timer.setInterval(75)
+        self._skill_timer.timeout.connect(self._apply_skill_change)
+        # Preference writes are coalesced to at most one per 500 ms
+        self._prefs_timer = QTimer(self)
+        self._prefs_timer.setSingleShot(True)
+        self._prefs_timer.setInterval(500)
+        self._prefs_timer.timeout.connect(self._flush_prefs)
+        self._prefs_dirty = False  # Unsaved preference changes pending
+        # Player saves from the reset buttons share the same debounce window
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_player_save)
+        self._player_dirty = False  # Unsaved player changes pending
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.flush_pending_save)
+        
         # Create main layout
         main_layout = QHBoxLayout(self)
         
@@ -642,7 +650,7 @@ class ImprovedCraftingTab(BaseTab):
         
         for profession in crafting_professions:
             self.profession_combo.addItem(profession.name.replace('_', ' ').title(), profession)
-        self.profession_combo.currentTextChanged.connect(self.on_profession_change)
+        self.profession_combo.currentIndexChanged.connect(self._on_profession_index)
         profession_layout.addWidget(self.profession_combo)
         
         profession_layout.addStretch()
@@ -782,6 +790,9 @@ class ImprovedCraftingTab(BaseTab):
         
         # Container for recipe buttons
         self.recipe_container = QWidget()
+        # Recipe buttons check one at a time
+        self._recipe_group = QButtonGroup(self)
+        self._recipe_group.setExclusive(True)
         self.recipe_layout = QVBoxLayout(self.recipe_container)
         self.recipe_layout.setSpacing(5)
         self.recipe_layout.addStretch()  # Push buttons to top
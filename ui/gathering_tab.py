@@ -11,6 +11,16 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Dropdown label -> profession; the one source for both the combo items and the lookup
+_PROFESSION_BY_LABEL = {
+    "Mining ⛏️": GatheringProfession.MINING,
+    "Lumberjack 🪓": GatheringProfession.LUMBERJACK,
+    "Harvester 🌾": GatheringProfession.HARVESTER,
+    "Fishing 🎣": GatheringProfession.FISHING,
+    "Hunter 🏹": GatheringProfession.HUNTER,
+    "Animal Keeper 🐄": GatheringProfession.ANIMAL_KEEPER,
+}
+
 class GatheringTab(BaseTab):
     def __init__(self):
         super().__init__("Gathering")
@@ -84,10 +94,7 @@ class GatheringTab(BaseTab):
         # Profession selection
         layout.addWidget(QLabel("Profession:"), 0, 0)
         self.profession_select = QComboBox()
-        self.profession_select.addItems([
-            "Mining ⛏️", "Lumberjack 🪓", "Harvester 🌾", 
-            "Fishing 🎣", "Hunter 🏹", "Animal Keeper 🐄"
-        ])
+        self.profession_select.addItems(list(_PROFESSION_BY_LABEL))
         self.profession_select.currentTextChanged.connect(self.on_profession_change)
         layout.addWidget(self.profession_select, 0, 1)
         
@@ -344,27 +351,15 @@ class GatheringTab(BaseTab):
 
     def on_profession_change(self, profession_text):
         """Handle profession change"""
-        prof_name = profession_text.split()[0]  # Remove emoji
-        
-        # Map dropdown names to enum names
-        profession_mapping = {
-            "Mining": "MINING",
-            "Lumberjack": "LUMBERJACK", 
-            "Harvester": "HARVESTER",
-            "Fishing": "FISHING",
-            "Hunter": "HUNTER",
-            "Animal": "ANIMAL_KEEPER"  # "Animal Keeper" -> first word is "Animal"
-        }
-        
-        enum_name = profession_mapping.get(prof_name, prof_name.upper())
+        profession = _PROFESSION_BY_LABEL.get(profession_text)
+        if profession is None:
+            logger.error(f"❌ Invalid profession: {profession_text}")
+            return
         
-        try:
-            self.current_profession = GatheringProfession[enum_name]
-            logger.info(f"🔄 Changed gathering profession to: {prof_name}")
-            self.update_profession_display()
-            self.update_location_display()
-        except KeyError:
-            logger.error(f"❌ Invalid profession: {prof_name}")
+        self.current_profession = profession
+        logger.info(f"🔄 Changed gathering profession to: {profession.name.title()}")
+        self.update_profession_display()
+        self.update_location_display()
 
     def update_profession_display(self):
         """Update profession-related displays"""
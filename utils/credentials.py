@@ -0,0 +1,73 @@
+"""
+API credential storage for Quinfall Companion - OS keyring when installed, saves/api_credentials.json otherwise
+"""
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from utils import json_io
+
+try:
+    import keyring
+    from keyring.errors import KeyringError
+except ImportError:  # Optional; secrets stay in the JSON file without it
+    keyring = None
+    KeyringError = Exception
+
+logger = logging.getLogger(__name__)
+
+KEYRING_SERVICE = "QuinfallCompanion"
+CREDENTIALS_FILE = Path("saves/api_credentials.json")
+SECRET_KEYS = ("api_key", "username", "password")
+
+@dataclass(slots=True, frozen=True)
+class APICredentials:
+    """Credentials entered by the user for one test or save"""
+    api_key: str = field(default="", repr=False)
+    username: str = ""
+    password: str = field(default="", repr=False)
+    
+    def is_complete(self) -> bool:
+        """True when there is an API key or a full username/password pair"""
+        return bool(self.api_key or (self.username and self.password))
+    
+    def as_dict(self) -> dict:
+        """Non-empty fields, keyed like the credentials file"""
+        return {key: value for key, value in asdict(self).items() if value}
+
+def load_credentials() -> dict:
+    """Saved credentials, with secrets from the keyring taking precedence"""
+    creds = {}
+    try:
+        if CREDENTIALS_FILE.exists():
+            creds = json_io.load_path(CREDENTIALS_FILE)
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ Could not read credentials file: {e}")
+
+    if keyring is not None:
+        try:
+            for key in SECRET_KEYS:
+                value = keyring.get_password(KEYRING_SERVICE, key)
+                if value:
+                    creds[key] = value
+        except KeyringError as e:
+            logger.warning(f"⚠️ Keyring unavailable: {e}")
+    return creds
+
+def save_credentials(creds: dict):
+    """Replace saved credentials; secrets go to the keyring when it is available"""
+    data = {k: v for k, v in creds.items() if v is not None}
+
+    if keyring is not None:
+        try:
+            for key in SECRET_KEYS:
+                if key in data:
+                    keyring.set_password(KEYRING_SERVICE, key, data[key])
+            data = {k: v for k, v in data.items() if k not in SECRET_KEYS}
+        except KeyringError as e:
+            logger.warning(f"⚠️ Keyring unavailable, keeping credentials in file: {e}")
+
+    if data:
+        json_io.dump_path(CREDENTIALS_FILE, data, indent=True)
+    else:
+        # Everything lives in the keyring; drop any stale plaintext copy
+        CREDENTIALS_FILE.unlink(missing_ok=True)
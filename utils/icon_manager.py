@@ -12,9 +12,15 @@ from dataclasses import dataclass
 import time
 from bs4 import BeautifulSoup
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=64)
+def _normalize_profession(profession: str) -> str:
+    """Profession name as a known_icons key; only a dozen or so distinct inputs"""
+    return profession.lower().replace(' ', '').replace('-', '')
+
 @dataclass
 class QuinfallIcon:
     """Represents a Quinfall icon with metadata"""
@@ -173,8 +179,8 @@ class QuinfallIconManager:
     
     def get_profession_icon(self, profession: str) -> str:
         """Get emoji icon for profession"""
-        normalized = profession.lower().replace(' ', '').replace('-', '')
-        return self.known_icons.get(normalized, '🔨')
+        # The lookup itself stays live: auto_discover_icons can add keys
+        return self.known_icons.get(_normalize_profession(profession), '🔨')
     
     def get_rarity_color(self, rarity: str) -> str:
         """Get color for item rarity"""
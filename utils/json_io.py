@@ -0,0 +1,46 @@
+"""
+JSON helpers for Quinfall Companion App - uses orjson when installed, stdlib json otherwise
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, not a hard dependency
+    orjson = None
+
+def loads(data) -> Any:
+    """Decode JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def load_path(path: Path) -> Any:
+    """Read and decode a JSON file in binary mode"""
+    return loads(Path(path).read_bytes())
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Encode obj as JSON bytes, compact unless indent is set (2 spaces)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def dump_path(path: Path, obj, indent: bool = False):
+    """Write obj as JSON via a temp file and rename, so readers never see a partial file"""
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    data = dumps(obj, indent)
+    try:
+        try:
+            tmp.write_bytes(data)
+        except FileNotFoundError:
+            # main() creates saves/ at startup; scripts and tests may run without it
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
@@ -4,13 +4,12 @@ Quinfall API Client for syncing storage data with official game servers
 """
 
 import requests
-import json
 import logging
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
+from utils.credentials import load_credentials, save_credentials
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -95,23 +94,18 @@ class QuinfallAPIClient:
     def _load_credentials(self):
         """Load saved API credentials"""
         try:
-            creds_file = Path("saves/api_credentials.json")
-            if creds_file.exists():
-                with open(creds_file, 'r') as f:
-                    creds = json.load(f)
-                    self.config.access_token = creds.get('access_token')
-                    self.config.refresh_token = creds.get('refresh_token')
-                    self.config.api_key = creds.get('api_key')
-                    logger.info("📋 Loaded saved API credentials")
+            creds = load_credentials()
+            if creds:
+                self.config.access_token = creds.get('access_token')
+                self.config.refresh_token = creds.get('refresh_token')
+                self.config.api_key = creds.get('api_key')
+                logger.info("📋 Loaded saved API credentials")
         except Exception as e:
             logger.warning(f"⚠️ Could not load credentials: {e}")
     
     def _save_credentials(self):
         """Save API credentials securely"""
         try:
-            creds_file = Path("saves/api_credentials.json")
-            creds_file.parent.mkdir(exist_ok=True)
-            
             creds = {
                 'access_token': self.config.access_token,
                 'refresh_token': self.config.refresh_token,
@@ -119,9 +113,7 @@ class QuinfallAPIClient:
                 'last_updated': datetime.now().isoformat()
             }
             
-            with open(creds_file, 'w') as f:
-                json.dump(creds, f, indent=2)
-                
+            save_credentials(creds)
             logger.info("💾 Saved API credentials")
         except Exception as e:
             logger.error(f"❌ Could not save credentials: {e}")
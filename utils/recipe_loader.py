@@ -3,7 +3,9 @@ Recipe Loader for Quinfall Companion App
 Loads recipes from JSON files and provides filtering functionality
 """
 
-import json
+from bisect import bisect_left
+from operator import attrgetter
+import threading
 from pathlib import Path
 import logging
 
@@ -11,77 +13,110 @@ logger = logging.getLogger(__name__)
 
 from typing import List, Dict, Any
 from data.enums import Profession, ToolType, ProfessionTier, Recipe
+from utils import json_io
+
+# Map tool type based on profession
+TOOL_TYPE_MAP = {
+    Profession.WEAPONSMITH: ToolType.FORGE,
+    Profession.ARMORSMITH: ToolType.ANVIL,
+    Profession.ALCHEMY: ToolType.ALCHEMY_TABLE,
+    Profession.COOKING: ToolType.COOKING_STATION,
+    Profession.WOODWORKING: ToolType.WORKBENCH,
+    Profession.JEWELCRAFTING: ToolType.JEWELING_TABLE,
+    Profession.ENCHANTING: ToolType.ENCHANTING_TABLE,
+    Profession.SHIPBUILDING: ToolType.SHIPYARD,
+    Profession.TAILORING: ToolType.LOOM,
+}
+
+# Highest skill level of each tier but the last: <=10 apprentice, <=20 journeyman, else master
+TIER_CAPS = (10, 20)
+TIERS = (ProfessionTier.APPRENTICE, ProfessionTier.JOURNEYMAN, ProfessionTier.MASTER)
+
+# Legacy file holding both weapon and armor recipes, split by item name
+LEGACY_BLACKSMITHING = "recipes_blacksmithing.json"
+WEAPON_WORDS = ('sword', 'dagger', 'axe', 'bow', 'staff', 'pickaxe')
+
+# CRAFTING PROFESSIONS (these have recipes) -> files read for them, in order
+RECIPE_FILES = {
+    Profession.ALCHEMY: ("recipes_alchemy.json",),
+    Profession.COOKING: ("recipes_cooking.json",),
+    Profession.WEAPONSMITH: ("recipes_weaponsmith.json", LEGACY_BLACKSMITHING),
+    Profession.ARMORSMITH: ("recipes_armorsmith.json", LEGACY_BLACKSMITHING),
+    Profession.WOODWORKING: ("recipes_woodworking.json",),
+    Profession.SHIPBUILDING: ("recipes_shipbuilding.json",),
+    # Legacy file, TAILORING is now its own crafting profession
+    Profession.TAILORING: ("recipes_tailoring.json",),
+}
 
 class RecipeLoader:
-    """Loads and manages recipes from JSON files"""
+    """Loads and manages recipes from JSON files, one profession at a time on first use"""
+    
+    # Parsed recipes per profession, shared by every loader instance
+    _recipe_cache: Dict[Profession, List[Recipe]] = {}
+    # Blacksmithing recipes split into (weapon, armor) lists, parsed once for both professions
+    _blacksmithing_split = None
+    _blacksmithing_lock = threading.Lock()  # The preload task and a first use may load it at once
     
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent / "data"
-        self.recipes_cache = {}
-        self.load_all_recipes()
+        self.recipes_cache = self._recipe_cache
     
     def load_all_recipes(self):
-        """Load all recipes from JSON files"""
-        recipe_files = {
-            # CRAFTING PROFESSIONS (these have recipes)
-            Profession.ALCHEMY: "recipes_alchemy.json",
-            Profession.COOKING: "recipes_cooking.json", 
-            Profession.WEAPONSMITH: "recipes_weaponsmith.json",
-            Profession.ARMORSMITH: "recipes_armorsmith.json",
-            Profession.WOODWORKING: "recipes_woodworking.json",
-            Profession.SHIPBUILDING: "recipes_shipbuilding.json",
-            # Legacy files that need proper mapping
-            "WEAPONSMITH": "recipes_blacksmithing.json",
-            "TAILORING": "recipes_tailoring.json"
-        }
-        
-        for profession_key, filename in recipe_files.items():
-            file_path = self.data_dir / filename
-            if file_path.exists():
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        recipes = self._parse_recipes(data, profession_key)
-                        
-                        # Handle legacy profession mapping
-                        if profession_key == "WEAPONSMITH":
-                            # Split weaponsmith recipes between weaponsmith and armorsmith
-                            weapon_recipes = []
-                            armor_recipes = []
-                            for recipe in recipes:
-                                if any(weapon_word in recipe.name.lower() for weapon_word in 
-                                      ['sword', 'dagger', 'axe', 'bow', 'staff', 'pickaxe']):
-                                    recipe.profession = Profession.WEAPONSMITH
-                                    weapon_recipes.append(recipe)
-                                else:
-                                    recipe.profession = Profession.ARMORSMITH
-                                    armor_recipes.append(recipe)
-                            
-                            # Add to existing or create new
-                            if Profession.WEAPONSMITH in self.recipes_cache:
-                                self.recipes_cache[Profession.WEAPONSMITH].extend(weapon_recipes)
-                            else:
-                                self.recipes_cache[Profession.WEAPONSMITH] = weapon_recipes
-                                
-                            if Profession.ARMORSMITH in self.recipes_cache:
-                                self.recipes_cache[Profession.ARMORSMITH].extend(armor_recipes)
-                            else:
-                                self.recipes_cache[Profession.ARMORSMITH] = armor_recipes
-                                
-                        elif profession_key == "TAILORING":
-                            # TAILORING is now its own crafting profession
-                            for recipe in recipes:
-                                recipe.profession = Profession.TAILORING
-                            
-                            if Profession.TAILORING in self.recipes_cache:
-                                self.recipes_cache[Profession.TAILORING].extend(recipes)
-                            else:
-                                self.recipes_cache[Profession.TAILORING] = recipes
-                        else:
-                            self.recipes_cache[profession_key] = recipes
-                            
-                except Exception as e:
-                    logger.error(f"Error loading {filename}: {e}")
+        """Load recipes for every profession that has recipe files"""
+        for profession in RECIPE_FILES:
+            self.get_recipes_for_profession(profession)
+    
+    def preload(self):
+        """Parse every profession not loaded yet (meant for a background task)"""
+        # One file after another: decoding holds the GIL, and a thread pool here
+        # measured about 2x slower than this loop
+        for profession in RECIPE_FILES:
+            if profession not in self._recipe_cache:
+                # Keep the list a first-use load may already have handed out
+                self._recipe_cache.setdefault(profession, self._load_profession_recipes(profession))
+    
+    def _load_profession_recipes(self, profession: Profession) -> List[Recipe]:
+        """Parse the JSON files for one profession, ordered by skill level (file order within a level)"""
+        recipes = []
+        for filename in RECIPE_FILES.get(profession, ()):
+            if filename == LEGACY_BLACKSMITHING:
+                weapons, armor = self._load_blacksmithing()
+                recipes.extend(weapons if profession == Profession.WEAPONSMITH else armor)
+            else:
+                recipes.extend(self._load_file(filename, profession))
+        recipes.sort(key=attrgetter('skill_level'))
+        return recipes
+    
+    def _load_blacksmithing(self):
+        """(weapon, armor) lists from the legacy blacksmithing file, parsed once"""
+        with RecipeLoader._blacksmithing_lock:
+            if RecipeLoader._blacksmithing_split is None:
+                RecipeLoader._blacksmithing_split = self._split_blacksmithing()
+        return RecipeLoader._blacksmithing_split
+    
+    def _split_blacksmithing(self):
+        """Split the legacy blacksmithing recipes between weaponsmith and armorsmith"""
+        weapon_recipes = []
+        armor_recipes = []
+        for recipe in self._load_file(LEGACY_BLACKSMITHING, "WEAPONSMITH"):
+            if any(weapon_word in recipe.name.lower() for weapon_word in WEAPON_WORDS):
+                recipe.profession = Profession.WEAPONSMITH
+                weapon_recipes.append(recipe)
+            else:
+                recipe.profession = Profession.ARMORSMITH
+                armor_recipes.append(recipe)
+        return weapon_recipes, armor_recipes
+    
+    def _load_file(self, filename: str, profession_key) -> List[Recipe]:
+        """Parse one recipe file ([] if missing or unreadable)"""
+        file_path = self.data_dir / filename
+        if not file_path.exists():
+            return []
+        try:
+            return self._parse_recipes(json_io.load_path(file_path), profession_key)
+        except Exception as e:
+            logger.error(f"Error loading {filename}: {e}")
+            return []
     
     def _parse_recipes(self, data: Dict[str, Any], profession_key) -> List[Recipe]:
         """Parse recipe data from JSON"""
@@ -115,27 +150,9 @@ class RecipeLoader:
                 
                 # Get skill level and determine tier
                 skill_level = recipe_data.get("skill_level", 1)
-                if skill_level <= 10:
-                    tier = ProfessionTier.APPRENTICE
-                elif skill_level <= 20:
-                    tier = ProfessionTier.JOURNEYMAN
-                else:
-                    tier = ProfessionTier.MASTER
+                tier = TIERS[bisect_left(TIER_CAPS, skill_level)]
                 
-                # Map tool type based on profession
-                tool_type_map = {
-                    Profession.WEAPONSMITH: ToolType.FORGE,
-                    Profession.ARMORSMITH: ToolType.ANVIL,
-                    Profession.ALCHEMY: ToolType.ALCHEMY_TABLE,
-                    Profession.COOKING: ToolType.COOKING_STATION,
-                    Profession.WOODWORKING: ToolType.WORKBENCH,
-                    Profession.JEWELCRAFTING: ToolType.JEWELING_TABLE,
-                    Profession.ENCHANTING: ToolType.ENCHANTING_TABLE,
-                    Profession.SHIPBUILDING: ToolType.SHIPYARD,
-                    Profession.TAILORING: ToolType.LOOM,
-                }
-                
-                tool_type = tool_type_map.get(profession, ToolType.WORKBENCH)
+                tool_type = TOOL_TYPE_MAP.get(profession, ToolType.WORKBENCH)
                 tool_level = recipe_data.get("tool_level", 1)
                 
                 # Create recipe object
@@ -158,15 +175,22 @@ class RecipeLoader:
         return recipes
     
     def get_recipes_for_profession(self, profession: Profession) -> List[Recipe]:
-        """Get all recipes for a specific profession"""
-        return self.recipes_cache.get(profession, [])
+        """Get all recipes for a specific profession, parsing its files on first request"""
+        recipes = self._recipe_cache.get(profession)
+        if recipes is None:
+            if profession not in RECIPE_FILES:
+                return []
+            recipes = self._recipe_cache.setdefault(profession, self._load_profession_recipes(profession))
+        return recipes
     
     def get_all_recipes(self) -> Dict[Profession, List[Recipe]]:
-        """Get all loaded recipes"""
+        """Get all recipes, loading any profession not read yet"""
+        self.load_all_recipes()
         return self.recipes_cache
     
     def get_recipe_by_name(self, name: str) -> Recipe:
         """Find a recipe by name across all professions"""
+        self.load_all_recipes()
         for recipes in self.recipes_cache.values():
             for recipe in recipes:
                 if recipe.name == name:
@@ -5,14 +5,14 @@ Recipe comparison utilities for Quinfall Companion App
 def compare_materials(old_mat, new_mat):
     """Compare material dictionaries between recipe versions"""
     changes = {}
-    all_materials = set(old_mat.keys()).union(set(new_mat.keys()))
+    old_keys, new_keys = old_mat.keys(), new_mat.keys()
     
-    for material in all_materials:
-        if material not in old_mat:
-            changes[material] = {"action": "added", "quantity": new_mat[material]}
-        elif material not in new_mat:
-            changes[material] = {"action": "removed", "quantity": old_mat[material]}
-        elif old_mat[material] != new_mat[material]:
+    for material in new_keys - old_keys:
+        changes[material] = {"action": "added", "quantity": new_mat[material]}
+    for material in old_keys - new_keys:
+        changes[material] = {"action": "removed", "quantity": old_mat[material]}
+    for material in old_keys & new_keys:
+        if old_mat[material] != new_mat[material]:
             changes[material] = {
                 "action": "quantity_changed",
                 "old": old_mat[material],
@@ -24,14 +24,14 @@ def compare_materials(old_mat, new_mat):
 def compare_output_stats(old_stats, new_stats):
     """Compare output stat dictionaries between recipe versions"""
     changes = {}
-    all_stats = set(old_stats.keys()).union(set(new_stats.keys()))
+    old_keys, new_keys = old_stats.keys(), new_stats.keys()
     
-    for stat in all_stats:
-        if stat not in old_stats:
-            changes[stat] = {"action": "added", "value": new_stats[stat]}
-        elif stat not in new_stats:
-            changes[stat] = {"action": "removed", "value": old_stats[stat]}
-        elif old_stats[stat] != new_stats[stat]:
+    for stat in new_keys - old_keys:
+        changes[stat] = {"action": "added", "value": new_stats[stat]}
+    for stat in old_keys - new_keys:
+        changes[stat] = {"action": "removed", "value": old_stats[stat]}
+    for stat in old_keys & new_keys:
+        if old_stats[stat] != new_stats[stat]:
             changes[stat] = {
                 "action": "value_changed",
                 "old": old_stats[stat],